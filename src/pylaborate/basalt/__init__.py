@@ -2,19 +2,23 @@
 
 import argparse
 import asyncio as aio
-from abc import abstractmethod
+import atexit
+from collections import defaultdict
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum
+from functools import cached_property, lru_cache
 from io import StringIO
 import inspect
 import logging
+import logging.handlers
 import os
 from pathlib import Path
 import paver.misctasks as misctasks
 import paver.tasks as tasks
 import concurrent.futures as cofutures
 import psutil
+import queue
 from pylaborate.common_staging import bind_enum, get_module, ModuleArg, origin_name, PathArg
 import shellous
 from shellous.redirect import Redirect
@@ -26,13 +30,35 @@ import traceback
 
 
 from types import FrameType, MappingProxyType, ModuleType, TracebackType
-from typing import Any, Generic, List, Literal, Optional, Protocol, Tuple, Union
+from typing import Any, ClassVar, Dict, Generic, List, Literal, Optional, Protocol, Set, Tuple, Union
 from typing_extensions import Self, Type, TypeAlias, TypeVar
 from collections.abc import Callable, Generator, Sequence, Mapping
 
 
 T = TypeVar("T")
 
+_SENTINEL = object()
+# ^ default value for getattr(), denoting an attribute not found
+
+
+@lru_cache(maxsize=1)
+def _default_max_workers() -> int:
+    ## default for -j/--max-workers, the number of CPUs available to this process
+    ##
+    ## cpu_affinity() is not available on every platform, e.g macOS.
+    ## If unavailable, this will use the number of CPUs on the host
+    try:
+        return len(psutil.Process().cpu_affinity())
+    except (AttributeError, NotImplementedError, psutil.Error):
+        return os.cpu_count() or 1
+
+
+_LOG_FORMAT = '[%(process)d %(asctime)s %(thread)x] [%(levelname)s] %(message)s'
+_FORMATTER_WITH_DATE = logging.Formatter(_LOG_FORMAT, datefmt = "%F %X")
+_FORMATTER_NO_DATE = logging.Formatter(_LOG_FORMAT, datefmt = "")
+# ^ log formatters for Cmdline.add_log_handlers()
+
+
 class FutureType(Protocol[T]):
     ## protocol class for  minimum API, compatible with
     ## concurrentfutures.Future and asyuncio.Future
@@ -50,41 +76,32 @@ class FutureType(Protocol[T]):
     ##   - remove_done_callback()
     ##   - get_loop()
 
-    @abstractmethod
     def cancel(self):
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def cancelled(self) -> bool:
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def running(self) -> bool:
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def done(self) -> bool:
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def result(self) -> T:
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def exception(self) -> Optional[Exception]:
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def add_done_callback(self, callback: Callable[[Self], Any]):
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def set_result(self, result: T):
-        return NotImplemented
+        ...
 
-    @abstractmethod
     def set_exception(self, exception: Exception):
-        return NotImplemented
+        ...
 
 
 class SemaphoreType(Protocol):
@@ -98,13 +115,11 @@ class SemaphoreType(Protocol):
     ##
     ## - asyncio.Semaphore does not support an increment arg
     ##
-    @abstractmethod
-    def acquire():
-        return NotImplemented
+    def acquire(self):
+        ...
 
-    @abstractmethod
-    def release():
-        return NotImplemented
+    def release(self):
+        ...
 
 
 SignalHandlerLiteral: TypeVar = Union[Literal[nsig.SIG_DFL], Literal[nsig.SIG_IGN]]
@@ -116,11 +131,21 @@ class SigContext():
     sigt: nsig.Signals
     previous: SignalHandlerType
     handler: SignalHandlerType
+    loop: Optional[aio.AbstractEventLoop] = None
+    ## ^ if provided, the event loop under which the handler was installed
 
     @classmethod
-    def activate(cls, sigt: nsig.Signals, handler: SignalHandlerType) -> Self:
-        previous = nsig.signal(sigt, handler)
-        return cls(sigt, previous, handler)
+    def activate(cls, sigt: nsig.Signals, handler: SignalHandlerType,
+                 loop: Optional[aio.AbstractEventLoop] = None) -> Self:
+        ## when a loop is provided, the handler will be installed only with
+        ## loop.add_signal_handler(), and will be called with the signal
+        ## as its only arg
+        previous = nsig.getsignal(sigt)
+        if loop:
+            loop.add_signal_handler(sigt, handler, sigt)
+        else:
+            nsig.signal(sigt, handler)
+        return cls(sigt, previous, handler, loop)
 
     @staticmethod
     def get_signal(signum: Union[nsig.Signals, int]):
@@ -130,7 +155,13 @@ class SigContext():
             return nsig.Signal(signum)
 
     def restore(self):
-        nsig.signal(self.sigt, self.previous)
+        loop = self.loop
+        if loop:
+            loop.remove_signal_handler(self.sigt)
+        previous = self.previous
+        if previous is not None:
+            ## previous is None when the handler was not installed from Python
+            nsig.signal(self.sigt, previous)
 
 
 @dataclass(init = True, eq = False, order = False, frozen=True)
@@ -167,9 +198,8 @@ class FutureManager():
         exc_cb = self.exception_callback
         try:
             # fmt: off
-            Basalt.instance.logger.log(LogLevel.TRACE,
-                                       "%s: __exit__ in FutureManager for %s",
-                                       self.task, self.future)
+            Basalt.instance().trace("%s: __exit__ in FutureManager for %s",
+                                    self.task, self.future)
             # fmt: on
         except Exception:
             if exc_cb:
@@ -219,6 +249,13 @@ class TaskProxyBase(Generic[Tsk, T]):
     launch_map: "TaskLaunchMap"
     # ^ used for locating reverse-dependent tasks under cancel_rdeps()
 
+    _idx: int = field(default=-1, init=False)
+    # ^ index of this task proxy in the build order, set under TaskLaunchMap
+
+    _deps_mask: int = field(default=0, init=False)
+    # ^ bitmap of the build order index for each task in depends,
+    # ^ set under TaskLaunchMap.finalize()
+
     def __hash__(self):
         return hash((self.task.name, self.run_future,))
 
@@ -252,15 +289,22 @@ class TaskProxyBase(Generic[Tsk, T]):
         return self.run_context.loop
 
     def can_run(self) -> bool:
-        runnable = not self.run_context.exit_future.cancelled()
-        if not runnable:
+        ## a task can run if no dependency task has already reached a
+        ## done state
+        if self.run_context.exit_future.cancelled():
             return False
+        launch_map = self.launch_map
+        if self._deps_mask & launch_map.deps_done:
+            return False
+        ## the deps_done bitmap is updated under a done callback for each
+        ## run_future, which may run after the future is done, e.g one loop
+        ## iteration later for an aio.Future. Each dependency not recorded
+        ## in the bitmap is checked directly
+        get_entry = launch_map.get_entry
         for task in self.depends:
-            entry = self.launch_map.get_entry(task)
-            if entry.run_future.done():
-                runnable = False
-                break
-        return runnable
+            if get_entry(task).run_future.done():
+                return False
+        return True
 
     def cancel_rdeps(self, *_):
         ## cancel all tasks that depend on this task, mainly on event of
@@ -342,8 +386,8 @@ class TaskProxyBase(Generic[Tsk, T]):
 
         env = self.receiver.environment
         env_opts = env.options
-        task_opts = getattr(env_opts, taskname) if hasattr(env_opts, taskname) else None
-        env_vars = dir(env)
+        task_opts = getattr(env_opts, taskname, None)
+        env_vars = frozenset(dir(env))
         use_args = dict()  # the keyword args to pass
         n = 0
         for n in range(0, nr_funcargs):
@@ -352,7 +396,8 @@ class TaskProxyBase(Generic[Tsk, T]):
             ## the order of precedence here may differ slightly, with
             ## regards to paver _run_task
             ##
-            if task_opts and hasattr(task_opts, arg):
+            opt_value = getattr(task_opts, arg, _SENTINEL) if task_opts else _SENTINEL
+            if opt_value is not _SENTINEL:
                 ## if the task has a named paver Bunch or other dict-like structure
                 ## under environment.options, i.e environment.options.<task_name>
                 ## and if the arg is provided with a value in that structure,
@@ -367,7 +412,7 @@ class TaskProxyBase(Generic[Tsk, T]):
                 ## have a Bunch under environment.options - whether or not the task
                 ## was defined with @cmdopts/@consume_args/@consume_nargs (?)
                 ##
-                use_args[arg] = getattr(task_opts, arg)
+                use_args[arg] = opt_value
             elif arg in env_vars:
                 use_args[arg] = getattr(env, arg)
             elif first_default and n >= first_default:
@@ -412,7 +457,7 @@ class SyncTaskProxy(TaskProxyBase[tasks.Task, "Basalt"]):
             task = self.task
             taskfunc = task.func
             kwargs = self.get_kwargs()
-            if kwargs and len(kwargs) is int(0):
+            if not kwargs:
                 kwargs = None
 
             if hasattr(task,'paver_constraint'):
@@ -457,17 +502,16 @@ class SyncTaskProxy(TaskProxyBase[tasks.Task, "Basalt"]):
                 hdl = executor.submit(self.callback)
 
                 # fmt: off
-                self.receiver.logger.log(LogLevel.TRACE,
-                                         "%s: Call delivered to executor. co-handle: %r",
-                                         taskname, hdl)
+                self.receiver.trace("%s: Call delivered to executor. co-handle: %r",
+                                    taskname, hdl)
                 # fmt: on
 
-                if self.receiver.log_level <= LogLevel.TRACE:
+                if self.receiver._trace_enabled:
                     def done_cb(cofuture):
                         nonlocal taskname, self
-                        self.receiver.logger.log(
+                        self.receiver.trace(
                             # fmt: off
-                            LogLevel.TRACE, "%s: Executor thread finished. local future: %r",
+                            "%s: Executor thread finished. local future: %r",
                             taskname, cofuture
                             # fmt: on
                         )
@@ -498,9 +542,8 @@ class SyncTaskProxy(TaskProxyBase[tasks.Task, "Basalt"]):
 
                 if exc:
                     # fmt: off
-                    self.receiver.logger.log(LogLevel.TRACE,
-                                             "%s: Exception during launch_sync_task: %r",
-                                             taskname, exc)
+                    self.receiver.trace("%s: Exception during launch_sync_task: %r",
+                                        taskname, exc)
                     # fmt: on
                     ## record any exception that may have been missed under the callback
                     self.defer_exception(self.task, exc.__class__, exc.args)
@@ -512,9 +555,8 @@ class SyncTaskProxy(TaskProxyBase[tasks.Task, "Basalt"]):
                     return exc
                 else:
                     # fmt: off
-                    self.receiver.logger.log(LogLevel.TRACE,
-                                             "%s: Returning from launch_sync_task, run_future %r",
-                                             taskname, run_future)
+                    self.receiver.trace("%s: Returning from launch_sync_task, run_future %r",
+                                        taskname, run_future)
                     # fmt: on
                     rslt = hdl.result()
                     run_future = self.run_future
@@ -542,9 +584,8 @@ class AsyncTaskProxy(TaskProxyBase[tasks.Task, "Basalt"]):
         run_future = self.run_future
         with self.managed_context():
             # fmt: off
-            self.receiver.logger.log(LogLevel.TRACE,
-                                     "%s: context enter => %s",
-                                     task, taskfunc)
+            self.receiver.trace("%s: context enter => %s",
+                                task, taskfunc)
             # fmt: on
             async with sem:
 
@@ -555,15 +596,15 @@ class AsyncTaskProxy(TaskProxyBase[tasks.Task, "Basalt"]):
                 # fmt: on
 
                 kwargs = self.get_kwargs()
-                if kwargs and len(kwargs) is int(0):
+                if not kwargs:
                     kwargs = None
 
-                    if hasattr(task, 'paver_constraint'):
-                        ## pre-exec function
-                        ##
-                        ## used under paver.virtual
-                        ## applied under paver.tasks.Task.call_task()
-                        task.paver_constraint()
+                if hasattr(task, 'paver_constraint'):
+                    ## pre-exec function
+                    ##
+                    ## used under paver.virtual
+                    ## applied under paver.tasks.Task.call_task()
+                    task.paver_constraint()
 
                 rslt = False
                 try:
@@ -592,12 +633,16 @@ class TaskLaunchMap:
     build_order: Sequence[Tx]
     launch_map: Mapping[str, Tx]
     finalized: bool
+    deps_done: int
+    # ^ bitmap of the build order index for each task whose run_future is done
 
     def __init__(self, run_context):
         self.run_context = run_context
         self.build_order = []
         self.launch_map =  dict()
         self.finalized = False
+        self.deps_done = 0
+        self._deps_lock = threading.Lock()
 
     def __hash__(self):
         return hash(self.build_order)
@@ -640,17 +685,35 @@ class TaskLaunchMap:
         cls = self.proxy_class_for_task(task)
         run_future = self.init_run_future(task)
         inst = cls(task, receiver, run_context, run_future, tuple(deps_data), tuple(rdeps_data), self)
+        idx = len(self.build_order)
+        ## the proxy class is frozen
+        object.__setattr__(inst, "_idx", idx)
         self.build_order.append(inst)
         name = task.name
         self.launch_map[name] = inst
+
+        bit = 1 << idx
+
+        def done_cb(_):
+            ## may be called from an executor thread, for a cofutures.Future
+            with self._deps_lock:
+                self.deps_done |= bit
+
+        run_future.add_done_callback(done_cb)
         return inst
 
     def finalize(self):
         if self.finalized:
             return False
         else:
+            launch_map = self.launch_map
+            for proxy in self.build_order:
+                mask = 0
+                for dep in proxy.depends:
+                    mask |= 1 << launch_map[dep]._idx
+                object.__setattr__(proxy, "_deps_mask", mask)
             self.build_order = tuple(self.build_order)
-            self.launch_map = MappingProxyType(self.launch_map)
+            self.launch_map = MappingProxyType(launch_map)
             self.finalized = True
             return True
 
@@ -700,6 +763,9 @@ class ArgparseAction():
 @dataclass(init=False, eq=False, order=False)
 class Cmdline:
 
+    _log_listeners: ClassVar[Dict[str, logging.handlers.QueueListener]] = {}
+    # ^ listeners for log records under add_log_handlers(), one for each logger name
+
     def __str__(self):
         return "<%s 0x%x>" % (self.__class__.__qualname__, id(self))
 
@@ -725,7 +791,7 @@ class Cmdline:
         The object returned from this class method will then be used to store
         any parsed options, pursuant of argument parsing within `consume_args()`
         """
-        return argparse.ArgumentParser(prog=self.program_name)
+        return argparse.ArgumentParser(prog=instance.program_name)
 
     def __call__(self, *args):
         """[tentative] this method may be removed in a subsequent revision"""
@@ -826,6 +892,9 @@ class Cmdline:
         The overriding method  should add any command options, subcommands, and other
         configuration to the `parser` provided to `configure_argparser()`.
 
+        The initialized argument parser will be stored for reuse in any later
+        call to `consume_args()` on the same instance.
+
         This default `consume_args()` implementation will then use value of the
         `option_namespace` attribute for the instance - denoted here as `ns` -
         calling `parser.parse_known_args(args, namespace=ns)` on the initialized
@@ -849,8 +918,11 @@ class Cmdline:
 
         (TBD)
         """
-        parser = self.__class__.init_argparser(self)
-        self.configure_argparser(parser)
+        parser = getattr(self, "_parser", None)
+        if parser is None:
+            parser = self.__class__.init_argparser(self)
+            self.configure_argparser(parser)
+            self._parser = parser
         ## using argparse.ArgumentParser.parse_known_args()
         ## - does not err on any unrecognized args
         ## - does not parse-out any unrecognized duplicate args
@@ -868,30 +940,68 @@ class Cmdline:
         ## default protocol method
         return LogLevel.INFO
 
-    @property
+    @cached_property
     def logger(self) -> logging.Logger:
-        if hasattr(self, "_logger"):
-            return self._logger
-        else:
-            ensure_log_levels()
-            logger = logging.getLogger(origin_name(self.__class__))
-            logger.setLevel(self.log_level)
-            self.add_log_handlers(logger)
-            self._logger = logger
-            return logger
+        ensure_log_levels()
+        logger = logging.getLogger(origin_name(self.__class__))
+        logger.setLevel(self.log_level)
+        self.add_log_handlers(logger)
+        return logger
 
     def add_log_handlers(self, logger: logging.Logger):
-        handler = logging.StreamHandler(stream = sys.stderr)
-        datefmt = ""
+        ## records for the logger will be dispatched through a queue,
+        ## such that each stream handler will be called from the thread
+        ## of a QueueListener, outside of the logging thread
+        ##
+        ## each logger receives its own queue and listener, such that
+        ## each record will be handled once, under the logger's handler
+        listeners = Cmdline._log_listeners
+        if logger.name in listeners:
+            ## records for this logger are already dispatched to a listener
+            return
+        stream_handler = logging.StreamHandler(stream = sys.stderr)
         level = self.log_level
-        if level < LogLevel.CRITICAL:
-            datefmt = "%F %X"
+        formatter = _FORMATTER_WITH_DATE if level < LogLevel.CRITICAL else _FORMATTER_NO_DATE
+        stream_handler.setFormatter(formatter)
+        stream_handler.setLevel(level)
+
+        if not listeners:
+            ## ensure that any queued records are handled at exit
+            atexit.register(Cmdline.stop_log_listener)
         # fmt: off
-        formatter = logging.Formatter('[%(process)d %(asctime)s %(thread)x] [%(levelname)s] %(message)s', datefmt=datefmt)
+        listener = logging.handlers.QueueListener(queue.SimpleQueue(), stream_handler,
+                                                  respect_handler_level = True)
         # fmt: on
-        handler.setFormatter(formatter)
-        handler.setLevel(level)
-        logger.addHandler(handler)
+        listener.start()
+        listeners[logger.name] = listener
+
+        queue_handler = logging.handlers.QueueHandler(listener.queue)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
+
+    @staticmethod
+    def flush_log_handlers():
+        ## handle any records queued for each log listener, from the
+        ## calling thread, then flush each handler. The listener threads
+        ## are not stopped
+        for listener in Cmdline._log_listeners.values():
+            records = listener.queue
+            while True:
+                try:
+                    record = records.get_nowait()
+                except queue.Empty:
+                    break
+                listener.handle(record)
+            for handler in listener.handlers:
+                handler.flush()
+
+    @staticmethod
+    def stop_log_listener():
+        ## handle any queued records, then flush each handler
+        for listener in Cmdline._log_listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
 
 
 class HelpFormatterCls(type):
@@ -1040,13 +1150,16 @@ class ShellCommandFailed(Exception):
 
 class ShellRunner(shellous.Runner):
     async def run_command(command, _run_future = None, proxy: "Optional[TaskWorkerBase]" = None):
-        mgr = None
+        if not isinstance(command, ShellCommand):
+            ## no task worker information is available for the command
+            return await shellous.Runner.run_command(command, _run_future = _run_future)
+
         task = None
         rfuture = _run_future
-        if isinstance(command, ShellCommand):
-            ## retrieve task worker information from the cmd, if not provided
-            proxy = proxy if proxy else command.task_proxy
-            mgr = proxy.receiver if proxy else None
+        ## retrieve task worker information from the cmd, if not provided
+        proxy = proxy if proxy else command.task_proxy
+        mgr = proxy.receiver if proxy else None
+        if mgr:
             if not rfuture:
                 rfuture = proxy.run_future
             if mgr.shell_show_commands:
@@ -1102,10 +1215,12 @@ class ShellContext(shellous.CmdContext[R]):
     Redirect: Type[shellous.redirect.Redirect] = Redirect
     def __call__(self, *args, stdout = Redirect.INHERIT, stderr = Redirect.INHERIT, stdin = Redirect.INHERIT, **kwargs) -> shellous.Command[R]:
 
-        # fmt: off
-        self.manager.logger.log(LogLevel.TRACE, "%s: new shell call: %s",
-                                self.__class__.__name__, args)
-        # fmt: on
+        manager = self.manager
+        if manager._trace_enabled:
+            # fmt: off
+            manager.logger.log(LogLevel.TRACE, "%s: new shell call: %s",
+                               self.__class__.__name__, args)
+            # fmt: on
 
 
         # fmt: off
@@ -1126,68 +1241,100 @@ class ShellContext(shellous.CmdContext[R]):
 class Basalt(Cmdline):
     ## cmdline app class for basalt
 
+    _instance: ClassVar[Optional["Basalt"]] = None
+    # ^ the bound instance, see bind_instance()
+
     def stop_on_exception(self):
         return True
 
 
     @classmethod
-    @property
-    def instance(cls):
-        if hasattr(cls, "_instance"):
-            return cls._instance
-        else:
+    def instance(cls) -> Self:
+        inst = cls._instance
+        if inst is None:
             raise UnboundValue("No bound instance: %r" % cls, cls)
+        return inst
 
     @classmethod
     def bind_instance(cls, new_value: Self):
-        if hasattr(cls, "_instance"):
+        inst = cls._instance
+        if inst is not None:
             # fmt: off
-            inst = getattr(cls, "_instance", "<missing>")
             raise BoundValue("Instance already bound: %r in %s" % (inst, cls,), inst, cls, new_value)
             # fmt: on
         else:
             cls._instance = new_value
 
-    @property
+    @cached_property
     def shell_context(self) -> ShellContext:
-        if not hasattr(self, "_shell_context"):
-            ctx = ShellContext(manager = self)
-            self._shell_context = ctx
-        return self._shell_context
+        return ShellContext(manager = self)
 
-    @property
+    @cached_property
     def shell_show_commands(self) -> bool:
-        if hasattr(self, "_show_shell_commands"):
-            return self._show_shell_commands
-        else:
-            show = not self.option_namespace.quiet
-            self._show_shell_commands = show
-            return show
+        return not self.option_namespace.quiet
 
-    @property
+    @cached_property
     def max_workers(self) -> int:
         ## used mainly for initializing the workers_semaphore
-        return self.option_namespace.max_workers
+        max_workers = self.option_namespace.max_workers
+        return _default_max_workers() if max_workers is None else max_workers
 
-    @property
+    @cached_property
     def log_level(self) -> int:
-        if hasattr(self, "_log_level"):
-            return self._log_level
+        ## must not be accessed until after the args are parsed
+        if self.option_namespace.quiet:
+            return LogLevel.CRITICAL
+        elif self.option_namespace.verbose >= 3:
+            return LogLevel.TRACE
+        elif self.option_namespace.verbose == 2:
+            return LogLevel.DEBUG
+        elif self.option_namespace.verbose == 1:
+            return LogLevel.INFO
         else:
-            level = -1
-            if self.option_namespace.quiet:
-                level = LogLevel.CRITICAL
-            elif self.option_namespace.verbose >= 3:
-                level = LogLevel.TRACE
-            elif self.option_namespace.verbose is int(2):
-                level = LogLevel.DEBUG
-            elif self.option_namespace.verbose is int(1):
-                level = LogLevel.INFO
-            else:
-                level = LogLevel.WARNING
-            self._log_level = level
-            return level
+            return LogLevel.WARNING
+
 
+    ## argument specifications for configure_argparser()
+    ##
+    ## each spec is a sequence of option strings, followed by a mapping
+    ## of keyword args for ArgumentParser.add_argument()
+    ##
+    ## the following table was transposed originally from _parse_global_options()
+    ## in the module paver.tasks for paver 1.3.4, then updated for the argparse API
+    ## and other features of the application in basalt
+    # autopep8: off
+    # fmt: off
+    _ARG_SPECS: ClassVar[Tuple[Tuple[Any, ...], ...]] = (
+        ('-j', '--max-workers', dict(action=ArgparseAction.STORE,
+                                     help="Maximum number of conccurent tasks (default: CPU count)",
+                                     type = int)),
+        ('-k', '--continue', dict(action=ArgparseAction.STORE_TRUE,
+                                  help="Continue after erred tasks")),
+        ('-n', '--dry-run', dict(action=ArgparseAction.STORE_TRUE,
+                                 help="don't actually do anything")),
+        ## changed: incremental verbosity
+        ('-v', "--verbose", dict(action=ArgparseAction.COUNT,
+                                 help="increase the verbosity of logging output. "
+                                 "Multiple values supported", default=0)),
+        ('-q', '--quiet', dict(action=ArgparseAction.STORE_TRUE,
+                               help="display only errors")),
+        # ('-h', "--help", dict(action=ArgparseAction.STORE_TRUE,
+        #                       help="display this help information.\n"
+        #                       "See also: help <task_name>")),
+        ("-i", "--interactive", dict(action=ArgparseAction.STORE_TRUE,
+                                     help="enable prompting")),
+        ## the default for --file is set from the paver environment,
+        ## under configure_argparser()
+        ("-f", "--file", dict(help="read tasks from FILE")),
+        ## added: short form "-t" arg for "--propagate-traceback"
+        ("-t", "--propagate-traceback", dict(action=ArgparseAction.STORE_TRUE,
+                                             help="propagate traceback, do not hide it under BuildFailure"
+                                             " (for debugging)")),
+        ('-x', '--command-packages', dict(action=ArgparseAction.STORE,
+                                          help="list of packages that provide distutils commands")),
+    )
+    # autopep8: on
+    # fmt: on
 
     def __init__(self):
         ## configuration for emulating paver.tasks.main()
@@ -1199,6 +1346,12 @@ class Basalt(Cmdline):
         self._n_exceptions = 0
         self._exceptions = queue.SimpleQueue()
         self._fold_exceptions = []
+        self._dep_order_cache = dict()  # syntax: Dict[str, Tuple[tasks.Task]]
+        self._task_cache = dict()  # syntax: Dict[str, tasks.Task]
+        self._help_cache = None  # syntax: Tuple[Hashable, str], see BasaltHelpFormatter
+        ## logging level flags, set under main() once the args are parsed
+        self._trace_enabled = False
+        self._debug_enabled = False
 
     @classmethod
     def init_argparser(cls, instance: Self):
@@ -1243,35 +1396,9 @@ class Basalt(Cmdline):
         # fmt: off
 
         envt.help_function = help
-        parser.add_argument('-j', '--max-workers', action=ArgparseAction.STORE,
-                            help="Maximum number of conccurent tasks",
-                            type = int,
-                            default = len(psutil.Process().cpu_affinity()))
-        parser.add_argument('-k', '--continue', action=ArgparseAction.STORE_TRUE,
-                            help="Continue after erred tasks"
-                            )
-
-        parser.add_argument('-n', '--dry-run', action=ArgparseAction.STORE_TRUE,
-                            help="don't actually do anything")
-        ## changed: incremental verbosity
-        parser.add_argument('-v', "--verbose", action=ArgparseAction.COUNT,
-                            help="increase the verbosity of logging output. "
-                            "Multiple values supported", default=0)
-        parser.add_argument('-q', '--quiet', action=ArgparseAction.STORE_TRUE,
-                            help="display only errors")
-        # parser.add_argument('-h', "--help", action=ArgparseAction.STORE_TRUE,
-        #                     help="display this help information.\n"
-        #                     "See also: help <task_name>")
-        parser.add_argument("-i", "--interactive", action=ArgparseAction.STORE_TRUE,
-                            help="enable prompting")
-        parser.add_argument("-f", "--file", default=envt.pavement_file,
-                            help="read tasks from FILE")
-        ## added: short form "-t" arg for "--propagate-traceback"
-        parser.add_argument("-t", "--propagate-traceback", action=ArgparseAction.STORE_TRUE,
-                            help="propagate traceback, do not hide it under BuildFailure"
-                            " (for debugging)")
-        parser.add_argument('-x', '--command-packages', action=ArgparseAction.STORE,
-                            help="list of packages that provide distutils commands")
+        for *flags, kwargs in self._ARG_SPECS:
+            parser.add_argument(*flags, **kwargs)
+        parser.set_defaults(file=envt.pavement_file)
         # autopep8: on
         # fmt: on
 
@@ -1294,23 +1421,33 @@ class Basalt(Cmdline):
             # fmt: off
             self,
             task: tasks.Task,
-            state: Optional[List[tasks.Task]] = None,
+            state: Optional[Set[Union[tasks.Task, str]]] = None,
             cur: Optional[Union[tasks.Task, str]] = None
             # fmt: on
     ):
         ## utility method for task scheduling under main()
+        ##
+        ## the dependency order for each task will be computed once,
+        ## under the first top-level call for the task
         if state is None:
-            state = []
-            cur = task
+            name = task.name
+            cache = self._dep_order_cache
+            order = cache.get(name, None)
+            if order is None:
+                order = tuple(self.get_dependency_order(task, set(), task))
+                cache[name] = order
+            yield from order
+            return
         elif cur in state:
             return
         else:
-            state.append(cur)
+            state.add(cur)
 
+        find_task = self.find_task
         if isinstance(cur, str):
-            cur = Basalt.instance.find_task(cur)
+            cur = find_task(cur)
 
-        needs = (Basalt.instance.find_task(id) for id in cur.needs)
+        needs = (find_task(id) for id in cur.needs)
 
         for dep in needs:
             if dep == task:
@@ -1322,7 +1459,14 @@ class Basalt(Cmdline):
             elif dep not in state:
                 yield from self.get_dependency_order(task, state, dep)
                 yield dep
-                state.append(dep)
+                state.add(dep)
+
+    def trace(self, fmt: str, *args):
+        ## log a message at TRACE level, if enabled for the logger
+        ##
+        ## The record will be attributed to the caller's source line
+        if self._trace_enabled:
+            self.logger.log(LogLevel.TRACE, fmt, *args, stacklevel = 2)
 
     def fold_exception(
             # fmt: off
@@ -1332,7 +1476,11 @@ class Basalt(Cmdline):
     ):
         # applied towards an alternate presentation of traceback information,
         # for failed shell commands under local shellous context
-        self._fold_exceptions.append(hash(folded))
+        #
+        # the folded args are recorded by object identity. The exception args
+        # may not be hashable. The args object itself is stored, such that
+        # its identity cannot be reused for other args while it is recorded
+        self._fold_exceptions.append(folded)
         self.push_exception_info(task, show_type, show_args, show_tbk)
 
     def push_exception_info(
@@ -1351,12 +1499,13 @@ class Basalt(Cmdline):
         ##
         ## The traceback, if provided, will be displayed under the cmdline args
         ## -t/--propagate-traceback
-        arghash = hash(exc_args)
-        if arghash in self._fold_exceptions:
+        folded = self._fold_exceptions
+        idx = next((n for n, args in enumerate(folded) if args is exc_args), None)
+        if idx is not None:
             # each exception in  _fold_exceptions is ignored, at most, once
             #
             # this value should always be accessed exclusively within the
-            # same thread as in which the hashed arg was added to
+            # same thread as in which the arg token was added to
             # _fold_exceptions
             #
             # _fold_exceptions should be empty at end of run
@@ -1374,7 +1523,7 @@ class Basalt(Cmdline):
             # data would already have been added, with a stack trace generally
             # indicating the source location of the call into shellous.
             #
-            self._fold_exceptions.remove(arghash)
+            del folded[idx]
         else:
             data = (task, exc_type, exc_args, tbk,)
             self._exceptions.put(data)
@@ -1403,12 +1552,57 @@ class Basalt(Cmdline):
         except queue.Empty:
             return
 
+    def format_exception_info(
+            # fmt: off
+            self, task: Optional[tasks.Task], exc_type: Type,
+            exc_args, tbk, show_tbk: bool = False
+            # fmt: on
+    ) -> str:
+        ## return the report text for exception information from
+        ## each_exception()
+        ##
+        ## The traceback, if provided, will be included when show_tbk
+        ## is true
+        parts = []
+        if task:
+            parts.append("Task error: %s: " % task.name)
+        else:
+            parts.append("Error: ")
+        # fmt: off
+        ## try to avoid redundant presentation of the execption type
+        if isinstance(exc_type, type) and not isinstance(exc_args, exc_type):
+            parts.append(exc_type.__qualname__)
+        if exc_args:
+            if isinstance(exc_args, Sequence):
+                ## expand any arg sequence into a string
+                parts.append("(" + ", ".join([repr(arg) for arg in exc_args]) + ")\n")
+            else:
+                parts.append(repr(exc_args) + "\n")
+        else:
+            parts.append("\n")
+        # fmt: on
+
+        if tbk and show_tbk:
+            parts.append("-- Traceback\n")
+            if isinstance(tbk, list):
+                parts.extend(repr(item) + "\n" for item in tbk)
+            elif isinstance(tbk, TracebackType):
+                parts.extend(traceback.format_tb(tbk))
+            else:
+                parts.append(repr(tbk) + "\n")
+        return "".join(parts)
+
     def find_task(self, task: Union[str, tasks.Task]) -> tasks.Task:
         if isinstance(task, tasks.Task):
             return task
         else:
+            cache = self._task_cache
+            rslt = cache.get(task, None)
+            if rslt:
+                return rslt
             rslt = self.environment.get_task(task)
             if rslt:
+                cache[task] = rslt
                 return rslt
             else:
                 raise ValueError("Task not found: %s" % repr(task))
@@ -1438,16 +1632,10 @@ class Basalt(Cmdline):
             ##
             ## process the build order from the launch_map
             run_tasks = launch_map.build_order
-            nr_tasks = len(run_tasks)
-            task_data = [False] * nr_tasks
-            for n in range(0, nr_tasks):
-                task_proxy = run_tasks[n]
-                task = task_proxy.task
-                taskname = task.name
-
-                aio_task = loop.create_task(task_proxy.launch_task(), name = taskname)
-
-                task_data[n] = (aio_task, task_proxy,)
+            # fmt: off
+            task_data = [(loop.create_task(proxy.launch_task(), name = proxy.task.name), proxy,)
+                         for proxy in run_tasks]
+            # fmt: on
 
             def cancel_aio_tasks(_):
                 nonlocal task_data
@@ -1457,34 +1645,37 @@ class Basalt(Cmdline):
             exit_future.add_done_callback(cancel_aio_tasks)
 
             self.logger.log(LogLevel.DEBUG, "amain: gathering tasks")
-            just_tasks = [False] * nr_tasks
-            for n in range(0, nr_tasks):
-                just_tasks[n] = task_data[n][0]
-            await aio.gather(*just_tasks, return_exceptions = True)
+            await aio.gather(*(aio_task for aio_task, _ in task_data), return_exceptions = True)
 
             try:
-                self.logger.log(LogLevel.DEBUG, "amain: finalizing task futures")
+                logger = self.logger
+                logger.log(LogLevel.DEBUG, "amain: finalizing task futures")
+                trace_enabled = self._trace_enabled
+                debug_enabled = self._debug_enabled
 
-                duration = sys.getswitchinterval()
-
-                for datum in task_data:
+                for aio_task, proxy in task_data:
 
-                    proxy = datum[1]
                     task = proxy.task
-                    self.logger.log(LogLevel.TRACE, "awaiting run_future for %r", proxy.task)
+                    if trace_enabled:
+                        logger.log(LogLevel.TRACE, "awaiting run_future for %r", task)
                     run_future = proxy.run_future
 
-                    while not run_future.done():
-                        ## Implementation Note:
-                        ##
-                        ## This section should be not be removed.
+                    if not run_future.done():
+                        ## waiting for the run_future to reach a done state,
+                        ## whether with a result, an exception, or cancelled.
                         ##
-                        await aio.sleep(duration)
+                        ## a cofutures.Future for a sync task will be wrapped
+                        ## as a future for the event loop
+                        if isinstance(run_future, aio.Future):
+                            waiter = run_future
+                        else:
+                            waiter = aio.wrap_future(run_future, loop = loop)
+                        await aio.wait((waiter,))
 
-                    aio_task = datum[0]
                     try:
                         if aio_task.done() is not True:
-                            self.logger.debug("Task future completed but aio task is not done, task %r (%r)", task, aio_task.done())
+                            if debug_enabled:
+                                logger.debug("Task future completed but aio task is not done, task %r (%r)", task, aio_task.done())
                             continue
                         ## try to capture any spare exceptions
                         exc = aio_task.exception()
@@ -1494,7 +1685,8 @@ class Basalt(Cmdline):
                     except (aio.CancelledError, cofutures.CancelledError):
                         pass
 
-                self.logger.log(LogLevel.TRACE, "Awaited tasks")
+                if trace_enabled:
+                    logger.log(LogLevel.TRACE, "Awaited tasks")
             except Exception:
                 self.push_exception_info(None, *sys.exc_info())
 
@@ -1518,7 +1710,10 @@ class Basalt(Cmdline):
 
         ## the user-indicated log level will not be available until
         ## after the args are parsed
-        self.logger.log(LogLevel.DEBUG, "main: parsed args")
+        logger = self.logger
+        self._trace_enabled = logger.isEnabledFor(LogLevel.TRACE)
+        self._debug_enabled = logger.isEnabledFor(LogLevel.DEBUG)
+        logger.log(LogLevel.DEBUG, "main: parsed args")
 
         exit_future = cofutures.Future()
 
@@ -1559,23 +1754,25 @@ class Basalt(Cmdline):
             auto_pending = (has_auto and auto_task)
             first_loop = True
             args = task_args
-            task_args_map = dict()  # syntax: Dict[str, Tuple[str]]
+            help_args = ()
+            ## ^ args following the 'help' task. Only the args for that task
+            ##   are used here, so no copy of the remaining args is made for
+            ##   any other task
             ## emulating paver.tasks._process_commands()
             ## - initialize each task here, using any parsed args
             ## - note paver.tasks._parse_command_line() @ definition & usage
             ## - note paver.tasks.Environment._run_task() @ definition & usage
-            while first_loop or len(args) is not int(0):
+            while first_loop or args:
                 ## by side effect, the following call may add new values
                 ## to environment.options -- e.g via Task.parse_args(),
                 ## subsequently Task._set_value_to_task() => sets options
                 task, args = tasks._parse_command_line(args)
                 if auto_pending and task and not task.no_auto and not task_help and task.shortname != "help":
                     to_sched.append(auto_task)
-                    task_args_map[auto_task.name] = ()
                     auto_pending = False
                 if task:
-                    task_args_map[task.name] = tuple(args)
                     if task.shortname == 'help':
+                        help_args = tuple(args)
                         task_help = True
                         to_sched.append(task)
                         continue
@@ -1586,7 +1783,6 @@ class Basalt(Cmdline):
                 elif first_loop and not task_help:  # when no task from args
                     task = tasks.environment.get_task('default')
                     if task:
-                        task_args_map[task.name] = tuple(args)
                         to_sched.append(task)
                     else:
                         ## no tasks provided in args, no default task
@@ -1606,13 +1802,13 @@ class Basalt(Cmdline):
                 self.environment.args_help = argparser.format_help().rstrip()
                 for task in to_sched:
                     shortname = task.shortname
-                    if shortname == "help" and len(to_call) is int(0):
+                    if shortname == "help" and not to_call:
                         to_call.append(task)
                     else:
                         to_describe.append(task)
-                task_args = task_args_map[to_call[0].name]
+                task_args = help_args
 
-                if len(to_describe) is int(0):
+                if not to_describe:
                     ## no other tasks listed - provide help only for the help task
                     to_describe = to_call
 
@@ -1624,7 +1820,7 @@ class Basalt(Cmdline):
             ## expanding the build order for each task and ensuring
             ## (by side effect) no circular task deps
             ##
-            rdeps_map = dict() ## str, List[str]
+            rdeps_map = defaultdict(list) ## str, List[str]
             deps_map = dict() ## str, List[str]
             ## - using task names in *deps_map to denote tasks, independent of
             ##   TaskProxy objects and the paver.tasks.Task contained in each
@@ -1635,12 +1831,7 @@ class Basalt(Cmdline):
                     ## ensure forward/reverse dependency information is recorded here
                     ordered_name = ordered_task.name
                     self_deps.append(ordered_name)
-                    rdeps_entry = rdeps_map.get(ordered_name, None)
-                    if rdeps_entry:
-                        rdeps_entry.append(to_name)
-                    else:
-                        rdeps_entry = [to_name]
-                        rdeps_map[ordered_name] = rdeps_entry
+                    rdeps_map[ordered_name].append(to_name)
 
                     ## avoiding duplicate task entries in the complete build map
                     ##
@@ -1690,34 +1881,38 @@ class Basalt(Cmdline):
                 launch_map.cancel()
 
             sigvars = vars(nsig.Signals).keys()
-            int_handler = SigContext.activate(nsig.SIGINT, cancel_main)
-            loop.add_signal_handler(nsig.SIGINT, cancel_main, nsig.SIGINT)
-            term_handler = SigContext.activate(nsig.SIGTERM, cancel_main)
-            loop.add_signal_handler(nsig.SIGTERM, cancel_main, nsig.SIGTERM)
+            int_handler = SigContext.activate(nsig.SIGINT, cancel_main, loop)
+            term_handler = SigContext.activate(nsig.SIGTERM, cancel_main, loop)
             quit_handler = None
             hup_handler = None
             if 'SIGQUIT' in sigvars:
-                quit_handler = SigContext.activate(nsig.SIGQUIT, cancel_main)
-                loop.add_signal_handler(nsig.SIGQUIT, cancel_main, nsig.SIGQUIT)
+                quit_handler = SigContext.activate(nsig.SIGQUIT, cancel_main, loop)
             if 'SIGHUP' in sigvars:
-                hup_handler = SigContext.activate(nsig.SIGHUP, cancel_main)
-                loop.add_signal_handler(nsig.SIGHUP, cancel_main, nsig.SIGHUP)
+                hup_handler = SigContext.activate(nsig.SIGHUP, cancel_main, loop)
 
 
-            ## blocking on the async amain call, by way of thread.join
+            ## blocking on the async amain call
             ##
-            ## this also ensures that the task loop can be started
-            ## and provided with the amain coroutine via Runner.run,
-            ## regardless of whether there's any loop running in the
-            ## current thread
+            ## when no loop is running in the current thread, the amain
+            ## coroutine is run directly via Runner.run. Otherwise, the
+            ## Runner.run call is dispatched to a new thread, blocking
+            ## by way of thread.join
 
             self.logger.log(LogLevel.DEBUG, "main: dispatching to amain")
 
             try:
                 coro = self.amain(run_context, launch_map)
-                thr = threading.Thread(target = runner.run, args=(coro,))
-                thr.start()
-                thr.join()
+                try:
+                    aio.get_running_loop()
+                    loop_running = True
+                except RuntimeError:
+                    loop_running = False
+                if loop_running:
+                    thr = threading.Thread(target = runner.run, args=(coro,))
+                    thr.start()
+                    thr.join()
+                else:
+                    runner.run(coro)
             finally:
                 int_handler.restore()
                 term_handler.restore()
@@ -1741,6 +1936,9 @@ class Basalt(Cmdline):
         ## process any deferred exception info
         ##
 
+        ## present any queued log records before the exception info
+        self.flush_log_handlers()
+
         show_tbk = self.option_namespace.show_traceback
         self.logger.debug("main: exception count: %d", self._n_exceptions)
         # fmt: off
@@ -1753,37 +1951,8 @@ class Basalt(Cmdline):
             (task, etype, eargs, etbk) = datum
             rc = rc + 1 if rc < 256 else rc
 
-            if task:
-                sys.stderr.write("Task error: %s: " % task.name)
-            else:
-                sys.stderr.write("Error: ")
-            # fmt: off
-            if isinstance(etype, type):
-                ## try to avoid redundant presentation of the execption type
-                if not (isinstance(etype, type) and isinstance(eargs, etype)):
-                    sys.stderr.write(etype.__qualname__)
-            if eargs:
-                if isinstance(eargs, Sequence):
-                    ## expand any arg sequence into a string
-                    sys.stderr.write("(")
-                    sys.stderr.write(", ".join(repr(arg) for arg in eargs))
-                    sys.stderr.write(")")
-                    print(file = sys.stderr)
-                else:
-                    print(repr(eargs), file = sys.stderr)
-            else:
-                print(file = sys.stderr)
-            # fmt: on
-
-            if etbk and show_tbk:
-                print("-- Traceback", file = sys.stderr)
-                if isinstance(etbk, list):
-                    for item in etbk:
-                        print(repr(item), file = sys.stderr)
-                elif isinstance(etbk, TracebackType):
-                    traceback.print_tb(etbk, file = sys.stderr)
-                else:
-                    print(repr(etbk))
+            ## the report for each exception is written to stderr in one call
+            sys.stderr.write(self.format_exception_info(task, etype, eargs, etbk, show_tbk))
 
             ## end of amain
             return rc
@@ -1824,14 +1993,22 @@ class Basalt(Cmdline):
             with open(file, mode="r") as io:
                 source = io.read()
             exec(compile(source, file, "exec"), mod.__dict__)
-        resident_tasks = self.get_resident_tasks()
-        for tsk in resident_tasks:
-            if not hasattr(mod, tsk):
-                setattr(mod, tsk, resident_tasks[tsk])
+        ## resident tasks will not override any names defined in the paver file
+        mod_dict = mod.__dict__
+        for tsk, value in self.get_resident_tasks().items():
+            mod_dict.setdefault(tsk, value)
         return file if exists else None
 
 
 class BasaltHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
+    def _get_help_string(self, action):
+        help = action.help
+        if help and "(default:" in help:
+            ## the default is described in the help text, e.g for
+            ## a default value resolved after the args are parsed
+            return help
+        return super()._get_help_string(action)
+
     def format_help(self):
         instance = self.prog
         ## args_str: the help text from the superclass' help formatter
@@ -1845,6 +2022,14 @@ class BasaltHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
         ##
         ## loading the paver file first, under help formatting
         file = instance.load_paver_file()
+
+        ## the task section of the help text will be reused, while the
+        ## paver file is unchanged
+        cache_key = (file, os.stat(file).st_mtime_ns,) if file else None
+        cached = instance._help_cache
+        if cached and cached[0] == cache_key:
+            return args_str + cached[1]
+
         environment = instance.environment
         task_list = environment.get_tasks()
         if len(task_list) == 0:
@@ -1865,14 +2050,16 @@ class BasaltHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
         task_list = sorted(task_list, key=lambda task: task.name)
         maxlen, task_list = tasks._group_by_module(task_list)
         out = StringIO()
-        print(args_str, file=out)
+        print(file=out)
         fmt = "  %-" + str(maxlen) + "s - %s"
         for group_name, group in task_list:
             print("\nTasks from %s:" % (group_name), file=out)
             for task in group:
                 if not getattr(task, "no_help", False):
                     print(fmt % (task.shortname, task.description), file=out)
-        return out.getvalue()
+        tasks_str = out.getvalue()
+        instance._help_cache = (cache_key, tasks_str,)
+        return args_str + tasks_str
 
 
 def basalt_help_formatter_class(
@@ -5,6 +5,7 @@ from collections import UserDict
 from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 import dataclasses as dc
+from functools import lru_cache
 
 # from itertools import chain
 import itertools
@@ -15,6 +16,7 @@ import os
 from pathlib import Path
 from pylaborate.common_staging import merge_mro, merge_map, get_logger, LogLevel
 import shlex
+import string
 import sys
 ## type hints
 from types import MappingProxyType
@@ -51,33 +53,42 @@ Tv = TypeVar('Tv')
 ##
 
 
-@dataclass(repr=False, order=False)
+@dataclass(repr=False, order=False, slots=True)
 class MkFormatter(Generic[Ts, Tv]):
     key: str
     source: Ts
     mapping: "MkVars"
     expansion: Optional[Tv] = None
+    _cache_version: int = -1
+    # ^ the version of the mapping at the time of the cached expansion
+    _cacheable: bool = True
+    # ^ whether the expansion depends only on the values in the mapping, such
+    #   that it may be reused until the version of the mapping changes
+    _value_class: Optional[Type] = None
+    # ^ the class for the expanded value, by default the class of the source
+    _log_prefix: Optional[str] = field(default=None, init=False)
+    # ^ static prefix for log messages, initialized under log_prefix()
 
 
     @property
     def value_class(self) -> Type:
-        if hasattr(self, "_value_class"):
-            return self._value_class
-        else:
+        cls = self._value_class
+        if cls is None:
             cls = self.source.__class__
             self._value_class = cls
-            return cls
+        return cls
 
     @value_class.setter
     def value_class(self, cls: Type):
         self._value_class = cls
 
     def key_for(self, value):
-        if __debug__:
+        if __debug__ and self.mapping.use_logging:
             ## return an informative key value, for debug purposes
             ##
             ## called when initializing a new MkFormatter for formatting
-            ## some value under the source of the calling MkFormatter
+            ## some value under the source of the calling MkFormatter.
+            ## The key is used only in log messages and repr()
             sk = self.key
             # fmt: off
             vcls = value.__class__.__name__
@@ -101,17 +112,14 @@ class MkFormatter(Generic[Ts, Tv]):
             return sk
         elif isinstance(sk, Sequence):
             ## this assumes a sequence of strings
-            return "(" + ", ".join(sk) + ")"
+            return f"({', '.join(sk)})"
         else:
             return repr(sk)
 
     def __repr__(self):
-        # fmt: off
-        return "<%s at 0x%x %s>" % (self.__class__.__qualname__, id(self), self.key_str)
-        # fmt: on
+        return f"<{self.__class__.__qualname__} at 0x{id(self):x} {self.key_str}>"
 
-    def __str__(self):
-        return repr(self)
+    __str__ = __repr__
 
     def expand(self, kwargs=None) -> Tv:
         ## method will be overridden in subclasses
@@ -122,49 +130,71 @@ class MkFormatter(Generic[Ts, Tv]):
         return object
 
     def parse(self, kwargs=None) -> MkVarsValue:
-        self.log_debug("MKFORMATTER PARSE @ %s : %s", self.key, repr(self.source))
+        self.log_debug("MKFORMATTER PARSE @ %s : %r", self.key, self.source)
         expansion = self.expansion
-        if expansion and not self.mapping.evaluate:
-            self.log_trace("MKFORMATTER CACHED %s", repr(expansion))
+        mapping = self.mapping
+        version = mapping._version
+        if (expansion and not mapping.evaluate) or self._cache_version == version:
+            self.log_trace("MKFORMATTER CACHED %r", expansion)
             return expansion
         else:
             source = self.source
             expansion = self.expand(source)
             self.expansion = expansion
-            self.log_trace("MKFORMATTER PARSED %s", repr(expansion))
+            self._cache_version = version if self._cacheable else -1
+            self.log_trace("MKFORMATTER PARSED %r", expansion)
             return expansion
 
     def update(self, source: MkVarsSource):
         self.source = source
         self.expansion = None
+        self._cache_version = -1
+        ## other formatters may have cached an expansion of this source
+        self.mapping._version += 1
 
     def reset(self):
         self.log_trace("RESET")
         self.expansion = None
+        self._cache_version = -1
+
+    def rebind(self, mapping: "MkVars"):
+        ## bind this formatter to a new mapping, as for a copy of the mapping
+        self.mapping = mapping
+        self.expansion = None
+        self._cache_version = -1
+
+    def log_prefix(self) -> str:
+        ## static prefix for log messages, escaped for use in a format string
+        prefix = self._log_prefix
+        if prefix is None:
+            prefix = ("%s %s: " % (self.__class__.__name__, self.key,)).replace("%", "%%")
+            self._log_prefix = prefix
+        return prefix
 
     def log_debug(self, message, *args):
-        self.mapping.log_debug(
-            "%s %s: " + message, self.__class__.__name__, self.key, *args
-        )
+        mapping = self.mapping
+        if mapping.use_logging:
+            mapping.log_debug(self.log_prefix() + message, *args)
 
     def log_trace(self, message, *args):
-        self.mapping.log_trace(
-            "%s %s: " + message, self.__class__.__name__, self.key, *args
-        )
+        mapping = self.mapping
+        if mapping.use_logging:
+            mapping.log_trace(self.log_prefix() + message, *args)
 
     def __iter__(self):
         source = self.source
-        if isinstance(source, Iterable):
-            yield from self.source
-        else:
-            raise TypeError("Not an iterable source", source, self)
+        try:
+            it = iter(source)
+        except TypeError:
+            raise TypeError("Not an iterable source", source, self) from None
+        yield from it
 
     def __len__(self):
         source = self.source
-        if isinstance(source, Iterable):
+        try:
             return len(source)
-        else:
-            raise TypeError("Not an iterable source", source, self)
+        except TypeError:
+            raise TypeError("Not an iterable source", source, self) from None
 
     def __copy__(self):
         cp = dc.replace(self)
@@ -178,30 +208,111 @@ class MkFormatter(Generic[Ts, Tv]):
 S = TypeVar("S")
 
 
-@dataclass(repr=False, order=False)
+_FORMAT_PARSER = string.Formatter()
+
+
+@lru_cache(maxsize=1024)
+def _compile_format(source: str) -> tuple:
+    ## parse a format string once, for StrFormatter and MkVars.parse()
+    ##
+    ## returns a tuple of (literal, field_name, format_spec) items, with
+    ## field_name None for trailing literal text. Returns an empty tuple
+    ## if any field uses a conversion, a nested format spec, attribute
+    ## or index access, or a positional name. Such a source will be
+    ## expanded with str.format_map
+    parts = []
+    for literal, name, spec, conversion in _FORMAT_PARSER.parse(source):
+        if name is not None:
+            if (not name or conversion or "{" in spec or "." in name
+                    or "[" in name or name.isdigit()):
+                return ()
+        parts.append((literal, name, spec,))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=1024)
+def _is_plain_format(source: str) -> bool:
+    ## true if each field in a format string is a top-level name, without
+    ## attribute or index access, including any fields in a nested spec.
+    ## An attribute or index field may reference a mutable object, such
+    ## that its expansion would not be cached under MkFormatter.parse()
+    for _, name, spec, _ in _FORMAT_PARSER.parse(source):
+        if name is not None:
+            if "." in name or "[" in name or ("{" in spec and not _is_plain_format(spec)):
+                return False
+    return True
+
+
+def _format_compiled(source: str, parts: tuple, mapping: Mapping) -> str:
+    ## expand a format string, given the parts from _compile_format()
+    if not parts:
+        return source.format_map(mapping)
+    buf = []
+    for literal, name, spec in parts:
+        buf.append(literal)
+        if name is not None:
+            buf.append(format(mapping[name], spec))
+    return "".join(buf)
+
+
+@dataclass(repr=False, order=False, slots=True)
 class StrFormatter(MkFormatter[S, str], Generic[S]):
+    _has_fields: Optional[bool] = None
+    # ^ whether the source string contains any braces, determined once per source
+    _parts: Optional[tuple] = None
+    # ^ the compiled format string, for a source with fields
+
     @classmethod
     def source_class(cls) -> Type[str]:
         return str
 
+    def expand_str(self, s: str) -> str:
+        has_fields = self._has_fields
+        if has_fields is None:
+            has_fields = "{" in s or "}" in s
+            self._has_fields = has_fields
+        if not has_fields:
+            return s
+        parts = self._parts
+        if parts is None:
+            parts = _compile_format(s)
+            self._parts = parts
+            self._cacheable = bool(parts) or _is_plain_format(s)
+        return _format_compiled(s, parts, self.mapping)
+
     def expand(self, overrides: Optional[MkVarsSourceMap] = None) -> str:
-        usemap = self.mapping
-        return self.source.format_map(usemap)
+        return self.expand_str(self.source)
 
+    def update(self, source: MkVarsSource):
+        MkFormatter.update(self, source)
+        self._has_fields = None
+        self._parts = None
+        self._cacheable = True
 
-@dataclass(repr=False, order=False)
+
+@dataclass(repr=False, order=False, slots=True)
 class PathFormatter(StrFormatter[Path]):
+    _source_str: Optional[str] = None
+    # ^ the string representation of the source pathname
+
     @classmethod
     def source_class(cls) -> Type[Path]:
         return Path
 
     def expand(self, overrides: MkVarsSourceMap) -> str:
         ## format the string representation of the pathname
-        s = str(self.source)
-        return s.format_map(self.mapping)
+        s = self._source_str
+        if s is None:
+            s = str(self.source)
+            self._source_str = s
+        return self.expand_str(s)
 
+    def update(self, source: MkVarsSource):
+        StrFormatter.update(self, source)
+        self._source_str = None
 
-@dataclass(repr=False, order=False)
+
+@dataclass(repr=False, order=False, slots=True)
 class VolatileFormatter(MkFormatter[Ts, Tv]):
     _volatile: Optional[Tv] = None
     _is_cached: bool = False
@@ -216,18 +327,45 @@ class VolatileFormatter(MkFormatter[Ts, Tv]):
         return cached
 
     def expand(self, _) -> Tv:
-        return self.mapping.parse(self.get_cached_value())
+        cached = self.get_cached_value()
+        if isinstance(cached, MkFormatter):
+            ## parse the wrapped formatter directly, without a further
+            ## dispatch under MkVars.parse()
+            expansion = cached.parse()
+            self._cacheable = cached._cacheable
+            return expansion
+        return self.mapping.parse(cached)
 
     def reset(self):
-        super().reset()
+        MkFormatter.reset(self)
         if self._is_cached:
             cached = self._volatile
             if isinstance(cached, MkFormatter):
                 self.log_trace("RESET CACHED")
                 cached.reset()
 
-@dataclass(repr=False, order=False)
+    def rebind(self, mapping: "MkVars"):
+        MkFormatter.rebind(self, mapping)
+        if self._is_cached:
+            cached = self._volatile
+            if isinstance(cached, MkFormatter):
+                ## the cached formatter may be shared with the original
+                ## formatter. The source value is retained, e.g for the
+                ## values from a generator
+                cached = cached.copy()
+                cached.rebind(mapping)
+                self._volatile = cached
+            else:
+                ## a container of formatters for the source. These will
+                ## be created again for the new mapping
+                self._volatile = None
+                self._is_cached = False
+
+@dataclass(repr=False, order=False, slots=True)
 class MapFormatter(VolatileFormatter[Mapping[str, Ts], Mapping[str, Tv]]):
+    _literal: bool = False
+    # ^ whether each value in the source would expand to itself
+
     @classmethod
     def source_class(cls) -> Type[Mapping]:
         return Mapping
@@ -235,25 +373,33 @@ class MapFormatter(VolatileFormatter[Mapping[str, Ts], Mapping[str, Tv]]):
     def wrap_volatile(self):
         assert self._volatile is None, "wrap_volatile called over a cached value"
         source = self.source
+        literal = all(_is_literal(v) for v in source.values())
+        self._literal = literal
+        if literal:
+            ## no formatter is needed for any value. expand() will
+            ## return a copy of the source
+            return source
         mapping = self.mapping
-        fmap = dict()
-        for k, v in source.items():
-            formatter = mapping.ensure_formatter(v, self.key_for(v))
-            fmap[k] = formatter
-        return fmap
+        ensure_formatter = mapping.ensure_formatter
+        if mapping.use_logging:
+            key_for = self.key_for
+            return {k: ensure_formatter(v, key_for(v)) for k, v in source.items()}
+        ## key_for() would return None
+        return {k: ensure_formatter(v) for k, v in source.items()}
 
     def expand(self, _):
+        ## each value in the cached mapping is a formatter, via wrap_volatile(),
+        ## unless the source contains only literal values
         formatted = self.get_cached_value()
-        mapping = self.mapping
-        newmap = dict()
-        for k, v in formatted.items():
-            expansion = mapping.parse(v)
-            newmap[k] = expansion
         cls = self.value_class
-        return cls(newmap)
+        if self._literal:
+            return cls(formatted)
+        expansion = cls({k: formatter.parse() for k, formatter in formatted.items()})
+        self._cacheable = all(formatter._cacheable for formatter in formatted.values())
+        return expansion
 
 
-@dataclass(repr=False, order=False)
+@dataclass(repr=False, order=False, slots=True)
 class SeqFormatter(VolatileFormatter[Sequence[Ts], Sequence[Tv]]):
     @classmethod
     def source_class(cls) -> Type[Sequence]:
@@ -265,26 +411,23 @@ class SeqFormatter(VolatileFormatter[Sequence[Ts], Sequence[Tv]]):
         assert self._volatile is None, "wrap_volatile called over a cached value"
         source = self.source
         mapping = self.mapping
-        n_elts = len(source)
-        formatters = [False] * n_elts
-        n = 0
-        for elt in source:
-            formatters[n] = mapping.ensure_formatter(elt, self.key_for(elt))
-            n = n + 1
-        return formatters
+        ensure_formatter = mapping.ensure_formatter
+        if mapping.use_logging:
+            key_for = self.key_for
+            return [ensure_formatter(elt, key_for(elt)) for elt in source]
+        ## key_for() would return None
+        return [ensure_formatter(elt) for elt in source]
 
     def expand(self, unused) -> Tv:
+        ## each element in the cached sequence is a formatter, via wrap_volatile()
         formatters = self.get_cached_value()
-        mapping = self.mapping
-        n_elts = len(formatters)
-        elts = [False] * n_elts
-        for n in range(0, n_elts):
-            elts[n] = mapping.parse(formatters[n])
         cls = self.value_class
-        return cls(elts)
+        expansion = cls([formatter.parse() for formatter in formatters])
+        self._cacheable = all(formatter._cacheable for formatter in formatters)
+        return expansion
 
 
-@dataclass(repr=False, order=False)
+@dataclass(repr=False, order=False, slots=True)
 class CallableFormatter(VolatileFormatter[Callable[[Ts], Tv], Tv]):
     @classmethod
     def source_class(cls) -> Type[Callable]:
@@ -299,7 +442,7 @@ class CallableFormatter(VolatileFormatter[Callable[[Ts], Tv], Tv]):
         return wrap
 
 
-@dataclass(repr=False, order=False)
+@dataclass(repr=False, order=False, slots=True)
 class GenFormatter(VolatileFormatter[Callable[[Generator], Tv], Tv]):
     as_value: Optional[Union[Type, Callable]] = tuple
 
@@ -311,7 +454,7 @@ class GenFormatter(VolatileFormatter[Callable[[Generator], Tv], Tv]):
         assert self._volatile is None, "wrap_volatile called over a cached value"
         wrap = self.as_value
         v = wrap(self.source)
-        self.log_trace("VOLATILE WRAPPED %s", repr(v))
+        self.log_trace("VOLATILE WRAPPED %r", v)
         formatter = self.mapping.ensure_formatter(v, self.key_for(v))
         self.log_trace("VOLATILE FORMATTER %s", formatter)
         return formatter
@@ -322,6 +465,67 @@ class GenFormatter(VolatileFormatter[Callable[[Generator], Tv], Tv]):
 ##
 
 
+@lru_cache(maxsize=256)
+def _split_cmd(cmd: str) -> tuple:
+    ## shlex.split() for MkVars.cmd(), cached for each expanded command string
+    return tuple(shlex.split(cmd))
+
+
+_LITERAL_CLASSES = frozenset((int, float, complex, bool, type(None),))
+# ^ classes of values stored without a formatter under MkVars.__setitem__,
+#   and returned without a formatter under MkVars.parse()
+
+
+def _is_literal(value) -> bool:
+    ## true if the value would expand to itself, i.e a value of a literal
+    ## class or a string without braces
+    cls = value.__class__
+    return cls in _LITERAL_CLASSES or (cls is str and "{" not in value and "}" not in value)
+
+_MISSING = object()
+# ^ sentinel for mapping lookup in MkVars
+
+
+class _MkVarsTable(dict):
+    ## the mapping table for a MkVars instance. Each change to the table
+    ## will increment the version of the owning MkVars, including any
+    ## change made directly to MkVars.mapping
+
+    __slots__ = ("owner",)
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.owner = None
+
+    def __setitem__(self, key, value):
+        self.owner._version += 1
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.owner._version += 1
+        dict.__delitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        self.owner._version += 1
+        dict.update(self, *args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self.owner._version += 1
+        return dict.setdefault(self, key, default)
+
+    def pop(self, *args):
+        self.owner._version += 1
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.owner._version += 1
+        return dict.popitem(self)
+
+    def clear(self):
+        self.owner._version += 1
+        dict.clear(self)
+
+
 @dataclass(repr=False, order=False)
 class MkVars(UserDict[str, MkVarsSource]):
     """Mapping type for macro-like expansion of formatted string values"""
@@ -330,10 +534,34 @@ class MkVars(UserDict[str, MkVarsSource]):
     # fmt: off
     use_logging: Union[bool, logging.Logger] = "MKVARS_LOG_VERBOSE" in os.environ
     # fmt: on
+    # ^ if false, log_debug() and log_trace() will return without formatting
+    #   any log message
 
     formatters: Sequence[Type[MkFormatter]] = field(default_factory=list)
     formatter_dispatch: Sequence[Type] = field(default_factory=list)
     evaluate: bool = True
+    _version: int = field(default=0, init=False)
+    # ^ modification counter, compared with each formatter's cached version
+    #   under MkFormatter.parse()
+    _dispatch_cache: dict[Type, Type[MkFormatter]] = field(default_factory=dict, init=False)
+    # ^ formatter classes resolved under formatter_class(), for each source type
+    _formatter_table: Optional[Mapping[Type, Type[MkFormatter]]] = field(default=None, init=False)
+    # ^ cached value for formatter_table()
+
+    def __post_init__(self):
+        ## static prefixes for log messages, escaped for use in a format string
+        prefix = ("! %x %s " % (id(self), self.__class__.__name__,)).replace("%", "%%")
+        self._log_prefix = prefix
+        self._log_trace_prefix = prefix + ".. "
+        ## a table from copy() is used as-is. Any other mapping is copied,
+        ## as under the UserDict constructor
+        mapping = self.mapping
+        if mapping.__class__ is not _MkVarsTable or mapping.owner is not None:
+            mapping = _MkVarsTable(mapping)
+            self.mapping = mapping
+        mapping.owner = self
+        ## integration with the UserDict API, as a plain attribute
+        self.data = mapping
 
     def formatter_table(self) -> Mapping[Type, Type[MkFormatter]]:
         """return a mapping of the formatter dispatch table for this MkVars instance
@@ -345,24 +573,34 @@ class MkVars(UserDict[str, MkVarsSource]):
         - `ensure_formatter_class()`
         - `formatter_class()`
         """
-        return MappingProxyType(dict(zip(self.formatter_dispatch, self.formatters)))
+        table = self._formatter_table
+        if table is None:
+            table = MappingProxyType(dict(zip(self.formatter_dispatch, self.formatters)))
+            self._formatter_table = table
+        return table
 
     def __str__(self):
-        keys = (repr(k) for k in self.keys())
-        return "<%s (%s)>" % (self.__class__.__name__, ", ".join(keys))
+        keys = ", ".join([repr(k) for k in self.mapping])
+        return "<%s (%s)>" % (self.__class__.__name__, keys)
 
     def __repr__(self):
-        keys = (repr(k) for k in self.keys())
-        return "<%s at 0x%x (%s)>" % (
-            self.__class__.__qualname__,
-            id(self),
-            ", ".join(keys),
-        )
+        keys = ", ".join([repr(k) for k in self.mapping])
+        return "<%s at 0x%x (%s)>" % (self.__class__.__qualname__, id(self), keys,)
 
-    @property
-    def data(self):
-        ## integration with the UserDict API
-        return self.mapping
+    ## the following methods access the mapping directly, rather than
+    ## through the UserDict implementation and the data attribute
+    ##
+    ## the UserDict base class is retained, such that get(), items(),
+    ## values(), and update() will dispatch to __getitem__ and __setitem__
+
+    def __contains__(self, key):
+        return key in self.mapping
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def __iter__(self):
+        return iter(self.mapping)
 
     @classmethod
     @property
@@ -384,19 +622,26 @@ class MkVars(UserDict[str, MkVarsSource]):
 
     def __getattr__(self, name: str):
         """Implementation for attribute-based reference to the mapping table of this MkVars"""
-        if not (name.startswith("_") or name.startswith("log")):
+        if name[:2] == "__" or name == "mapping":
+            ## not a mapped name. This also avoids a recursive lookup for
+            ## an instance that has not been initialized, e.g under copy
+            raise AttributeError("Attribute not found", name, self)
+        if self.use_logging and not (name[:1] == "_" or name[:3] == "log"):
             self.log_debug("GETATTR %s", name)
         try:
-            mapped = self.__getitem__(name)
+            return self.__getitem__(name)
         except KeyError:
             raise AttributeError("Attribute not found", name, self)
-        return mapped
 
     def __getitem__(self, name: str):
-        log_get = not ((name.startswith("_") or name.startswith("log")))
+        log_get = self.use_logging and not (name[:1] == "_" or name[:3] == "log")
         if log_get:
             self.log_debug("GETITEM %s", name)
-        item = super().__getitem__(name)
+        ## direct access to the mapping, bypassing UserDict.__getitem__.
+        ## MkVars does not define __missing__
+        item = self.mapping.get(name, _MISSING)
+        if item is _MISSING:
+            raise KeyError(name)
         if isinstance(item, MkFormatter):
             value = item.parse()
             if log_get:
@@ -404,71 +649,66 @@ class MkVars(UserDict[str, MkVarsSource]):
             return value
         else:
             if log_get:
-                self.log_debug("GETITEM %s LITERAL => %s", name, value)
+                self.log_debug("GETITEM %s LITERAL => %s", name, item)
             return item
 
     def __setitem__(self, key: str, value):
-        if not key.startswith("_"):
+        if self.use_logging and key[:1] != "_":
             self.log_debug("SETITEM %s  => %s", key, value)
         if isinstance(value, MkFormatter):
             super().__setitem__(key, value)
+        elif _is_literal(value):
+            ## values that would expand to themselves are stored without
+            ## a formatter. __getitem__ will return these values directly
+            super().__setitem__(key, value)
         else:
             self.ensure_formatter(value, key)
 
     def copy(self):
         self.log_debug("COPY")
-        newmap = self.mapping.copy()
-        ## approximating a tuple.copy()
-        formatters = tuple(fcls for fcls in self.formatters)
-        disp = tuple(cls for cls in self.formatter_dispatch)
-        ## copy formatters
+        ## the formatter and dispatch sequences are replaced as a whole under
+        ## ensure_formatter_class(), never modified, and may be shared
         mapping = self.mapping
-        nrmapped = len(mapping)
-        data = [False] * nrmapped
-        items = tuple(mapping.items())
-        for n in range(0, nrmapped):
-            nth = items[n]
-            key = nth[0]
-            value = nth[1]
-            if hasattr(value, "copy"):
-                copy = value.copy()
-            else:
-                copy = value
-            data[n] = (
-                key,
-                copy,
-            )
-        newmap = mapping.__class__(data)
+        # fmt: off
+        newmap = _MkVarsTable((key, value.copy() if hasattr(value, "copy") else value,)
+                              for key, value in mapping.items())
+        # fmt: on
         dup = dc.replace(
-            self, mapping=newmap, formatters=formatters, formatter_dispatch=disp
+            self, mapping=newmap, formatters=self.formatters,
+            formatter_dispatch=self.formatter_dispatch
         )
-        ## reset all formatters in the copy
-        dup.reset()
+        ## bind each formatter copy to the new mapping
+        for value in newmap.values():
+            if isinstance(value, MkFormatter):
+                value.rebind(dup)
+        ## each formatter copy was reset under copy() and rebind(). The new
+        ## mapping has a version of 0 from its initialization
+        dup.evaluate = True
         self.log_trace("COPY => %r", dup)
         return dup
 
     def reset(self):
         self.evaluate = True
+        self._version += 1
         self.log_debug("RESET")
-        for value in self.values():
+        ## the formatters in the mapping, rather than the expanded values
+        for value in self.mapping.values():
             if isinstance(value, MkFormatter):
                 value.reset()
 
     def log_debug(self, message, *args):
+        if not self.use_logging:
+            return
         logger = self.logger
-        if logger:
-            logger.log(
-                LogLevel.TRACE,
-                "! %x %s " + message,
-                id(self),
-                self.__class__.__name__,
-                *args,
-            )
+        if logger and logger.isEnabledFor(LogLevel.TRACE):
+            logger.log(LogLevel.TRACE, self._log_prefix + message, *args)
 
     def log_trace(self, message, *args):
-        self.log_debug(
-            "! %x %s .. " + message, id(self), self.__class__.__name__, *args
-        )
+        if not self.use_logging:
+            return
+        logger = self.logger
+        if logger and logger.isEnabledFor(LogLevel.TRACE):
+            logger.log(LogLevel.TRACE, self._log_trace_prefix + message, *args)
 
     def parse(
         # fmt: off
@@ -599,23 +839,45 @@ class MkVars(UserDict[str, MkVarsSource]):
         if kwargs is None:
             kwargs = self
 
-        self.log_trace("PARSE %s", repr(obj))
+        cls = obj.__class__
+        if cls is str:
+            ## shortcut for string values, bypassing the formatter dispatch.
+            ## The string will be expanded as under StrFormatter
+            if "{" in obj or "}" in obj:
+                return _format_compiled(obj, _compile_format(obj), self)
+            return obj
+        elif cls in _LITERAL_CLASSES:
+            ## values that would expand to themselves, under MkFormatter
+            return obj
+        elif isinstance(obj, MkFormatter):
+            return obj.parse()
+
+        use_logging = self.use_logging
+        if use_logging:
+            self.log_trace("PARSE %r", obj)
 
         formatter = self.ensure_formatter(obj)
-        self.log_trace("PARSE %s @ formatter %s", repr(obj), formatter)
+        if use_logging:
+            self.log_trace("PARSE %r @ formatter %s", obj, formatter)
         rslt = formatter.parse()
-        self.log_trace("PARSE %s => %s", repr(obj), repr(rslt))
+        if use_logging:
+            self.log_trace("PARSE %r => %r", obj, rslt)
         return rslt
 
     def eval(self) -> bool:
         ## returns a value indicating whether the instance was newly
         ## evaluated under the call
         if self.evaluate:
-            for key, source in self.mapping.items():
+            mapping = self.mapping
+            for key, source in mapping.items():
                 self.log_trace("SETVARS %s %s", key, source)
                 value = self.parse(source, None)
-                self.log_trace("SETVARS %s => %s", key, repr(value))
-                self[key] = value
+                self.log_trace("SETVARS %s => %r", key, value)
+                if _is_literal(value):
+                    ## store the expanded value directly
+                    mapping[key] = value
+                else:
+                    self[key] = value
             self.evaluate = False
             return True
         else:
@@ -653,7 +915,7 @@ class MkVars(UserDict[str, MkVarsSource]):
         for key, source in kwargs.items():
             self.log_trace("SETVARS %s %s", key, source)
             value = self.parse(source, None)
-            self.log_trace("SETVARS %s => %s", key, repr(value))
+            self.log_trace("SETVARS %s => %r", key, value)
             self[key] = value
 
     def dup(self, **kwargs) -> Self:
@@ -685,78 +947,85 @@ class MkVars(UserDict[str, MkVarsSource]):
         """
         mock = self.copy()
         self.log_debug("DUP %s => %s", self, mock)
-        mock.update(kwargs)
+        if kwargs:
+            mock.update(kwargs)
         return mock
 
     def define(self, **values):
-        self.log_debug("DEFINE %s", repr(values))
+        self.log_debug("DEFINE %r", values)
         return self.update(values)
 
     def update(self, *args, **values):
-        self.log_debug("UPDATE %s %s", repr(args), repr(values))
-        self.reset()
-        return super().update(*args, **values)
+        self.log_debug("UPDATE %r %r", args, values)
+        ## each change to the mapping table will invalidate any cached
+        ## expansion, without a reset() for each formatter
+        self.evaluate = True
+        setitem = self.__setitem__
+        for key, value in dict(*args, **values).items():
+            setitem(key, value)
 
     def value(self, source: MkVarsSource):
-        self.log_debug("VALUE %s", repr(source))
+        self.log_debug("VALUE %r", source)
         return self.parse(source, self)
 
     def cmd(self, source: Union[str, Callable[[], str]]):
-        self.log_debug("CMD %s", repr(source))
-        return shlex.split(self.value(source))
+        self.log_debug("CMD %r", source)
+        return list(_split_cmd(self.value(source)))
 
     def ensure_formatter_class(self, formatter: Type):
-        formatters = self.formatters
-        if formatter not in formatters:
-            fcls = formatter.source_class()
-            mro = fcls.__mro__
-            dispatch = self.formatter_dispatch
-            dispatch_table = dict(zip(dispatch, formatters))
-
-            def the_formatter(cls):
-                if cls in mro and cls not in dispatch:
-                    return formatter
-                else:
-                    return dispatch_table[cls]
-
-            # fmt: off
-            new_dispatch = tuple(merge_mro((fcls,*dispatch,)))
-            new_table = list(
-                zip(new_dispatch, (the_formatter(cls) for cls in new_dispatch))
-            )
-            # fmt: on
-
-            self.formatter_dispatch = tuple(d[0] for d in new_table)
-            self.formatters = tuple(d[1] for d in new_table)
+        self.extend_formatter_classes((formatter,))
+
+    def extend_formatter_classes(self, classes: Iterable[Type]):
+        ## register each formatter class in order, as under ensure_formatter_class()
+        ##
+        ## the dispatch sequence and formatter table are computed on local
+        ## values, then stored once for all classes
+        registered = list(self.formatters)
+        dispatch = tuple(self.formatter_dispatch)
+        table = dict(zip(dispatch, registered))
+        changed = False
+        for formatter in classes:
+            if formatter not in registered:
+                registered.append(formatter)
+                changed = True
+                fcls = formatter.source_class()
+                dispatch = tuple(merge_mro(itertools.chain((fcls,), dispatch)))
+                ## each class in the new dispatch sequence is either in the
+                ## previous dispatch sequence or in the MRO of fcls
+                for cls in fcls.__mro__:
+                    table.setdefault(cls, formatter)
+        if changed:
+            self.formatter_dispatch = dispatch
+            self.formatters = tuple(table[cls] for cls in dispatch)
+            self._dispatch_cache.clear()
+            self._formatter_table = None
 
     def init_formatters(self):
-        for cls in (
-            MkFormatter,
-            GenFormatter,
-            SeqFormatter,
-            MapFormatter,
-            PathFormatter,
-            CallableFormatter,
-            StrFormatter,
-        ):
-            self.ensure_formatter_class(cls)
+        # fmt: off
+        self.extend_formatter_classes((
+            MkFormatter, GenFormatter, SeqFormatter, MapFormatter,
+            PathFormatter, CallableFormatter, StrFormatter,
+        ))
+        # fmt: on
 
     def formatter_class(self, obj):
         ## return the MkFormatter class to use when creating a formatter for the object
         ## as under __getitem__
-        dispatch = self.formatter_dispatch
-        count = len(dispatch)
-        found = None
-        for n in range(0, count):
-            dcls = dispatch[n]
-            if isinstance(obj, dcls):
-                found = self.formatters[n]
-                break
+        ##
+        ## the formatter class will be resolved once for each class of object,
+        ## then stored in the dispatch cache
+        cls = obj.__class__
+        cache = self._dispatch_cache
+        found = cache.get(cls, None)
         if found is None:
-            cls = obj.__class__
-            raise ValueError("No formatter class found", cls)
-        else:
-            return found
+            for dcls, fcls in zip(self.formatter_dispatch, self.formatters):
+                if isinstance(obj, dcls):
+                    found = fcls
+                    break
+            if found is None:
+                raise ValueError("No formatter class found", cls)
+            cache[cls] = found
+        return found
 
     def ensure_formatter(self, source: Any, key: Optional[str] = None, **initargs):
         if isinstance(source, MkFormatter):
@@ -804,6 +1073,10 @@ def optional_files(*files: Sequence[str]) -> Generator[str, None, None]:
             yield pathname
 
 
+_BIN = "Scripts" if sys.platform == "win32" else "bin"
+# ^ name of the scripts subdirectory in a virtual environment, for venv_bindir()
+
+
 def venv_bindir(venv_dir: str) -> str:
     ## from project.py
     ##
@@ -816,7 +1089,4 @@ def venv_bindir(venv_dir: str) -> str:
     ## syntax in filesystem pathnames
     ##
     ## referenced onto venv ___init__.py, Python 3.9
-    if sys.platform == "win32":
-        return os.path.join(venv_dir, "Scripts")
-    else:
-        return os.path.join(venv_dir, "bin")
+    return os.path.join(venv_dir, _BIN)
@@ -13,17 +13,23 @@ project.
 
 __all__ = []
 
-from .naming import *  # NOQA E402
-export(__name__, module_all(__name__ + ".naming"))  # NOQA: F405
+from importlib import import_module  # NOQA E402
 
-from .io import *  # NOQA E402
-export(__name__, module_all(__name__ + ".io"))  # NOQA: F405
 
-from .iterlib import *  # NOQA E402
-export(__name__, module_all(__name__ + ".iterlib"))  # NOQA: F405
+def _reexport(*submodules):
+    ## import each submodule once, then bind and export each name
+    ## from the submodule's __all__ within this module
+    pkg = globals()
+    exported = set(__all__)
+    for submodule in submodules:
+        m = import_module(submodule, __name__)
+        for name in m.__all__:
+            pkg[name] = getattr(m, name)
+            if name not in exported:
+                exported.add(name)
+                __all__.append(name)
 
-from .meta import *  # NOQA E402
-export(__name__, module_all(__name__ + ".meta"))  # NOQA: F405
 
-from .loglib import *  # NOQA E402
-export(__name__, module_all(__name__ + ".loglib"))  # NOQA: F405
+_reexport(".naming", ".io", ".iterlib", ".meta", ".loglib")
+
+del import_module, _reexport
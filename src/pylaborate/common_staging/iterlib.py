@@ -1,7 +1,8 @@
 """Iterator utilities"""
 
+from collections import deque
 import inspect
-from itertools import chain
+from itertools import chain, islice
 
 from .naming import export
 
@@ -55,7 +56,9 @@ def first(source: Iterable[T]) -> T:
     ### Exceptions
 
     raises RuntimeError if the source yields no value"""
-    return next(first_gen(ensure_gen(source)))
+    for elt in source:
+        return elt
+    raise RuntimeError("No value in source", source)
 
 
 def last_gen(source: Iterable[T]) -> Yields[T]:
@@ -86,7 +89,11 @@ def last(source: Iterable[T]) -> T:
 
     raises RuntimeError if the source yields no value
     """
-    return next(last_gen(ensure_gen(source)))
+    ## consume the source under a bounded deque
+    tail = deque(source, maxlen=1)
+    if tail:
+        return tail[0]
+    raise RuntimeError("No value in source", source)
 
 
 def nth_gen(n: int, source: Yields[T]) -> Yields[T]:
@@ -121,8 +128,16 @@ def nth(n: int, source: Iterable[T]) -> T:
 
     Negative index values are not supported
     """
-    return next(nth_gen(n, ensure_gen(source)))
+    s = abs(int(n))
+    if s != n:
+        raise TypeError("Unsupported index value", n)
+    for elt in islice(source, s, None):
+        return elt
+    raise RuntimeError("No value at index in source", n, source)
+
 
+## sentinel for mapping lookup in merge_map()
+_NOT_FOUND = object()
 
 T_k = TypeVar("T_k")
 T_v = TypeVar("T_v")
@@ -211,19 +226,23 @@ def merge_map(source: Mapping[T_k, T_v],
     `merge_map()` will not detect any reference loop
     for values under the `source` mapping.
     """
-    not_found = object()
-    for key, value in source.items():
-        dvalue = dest.get(key, not_found)
-        if isinstance(value, Mapping) and dvalue is not not_found and isinstance(dvalue, Mapping):
-            merge_map(value, dvalue, callback)
-            continue
-        if callback is None:
-            dest[key] = value
-        elif dvalue is not_found:
-            dest[key] = callback(key, value, None, False)
-        else:
-            dest[key] = callback(key, value, dvalue, True)
-    del not_found
+    get = dest.get
+    if callback is None:
+        for key, value in source.items():
+            dvalue = get(key, _NOT_FOUND)
+            if dvalue is not _NOT_FOUND and isinstance(value, Mapping) and isinstance(dvalue, Mapping):
+                merge_map(value, dvalue)
+            else:
+                dest[key] = value
+    else:
+        for key, value in source.items():
+            dvalue = get(key, _NOT_FOUND)
+            if dvalue is _NOT_FOUND:
+                dest[key] = callback(key, value, None, False)
+            elif isinstance(value, Mapping) and isinstance(dvalue, Mapping):
+                merge_map(value, dvalue, callback)
+            else:
+                dest[key] = callback(key, value, dvalue, True)
     return dest
 
 
@@ -280,12 +280,16 @@ def export_annotated(module: ModuleArg) -> Optional[Sequence[str]]:
         return export(m, tuple(m.__annotations__.keys()))
 
 
+## sentinel for attribute lookup
+_NOT_FOUND = object()
+
+
 def origin_name(object) -> str:
-    if hasattr(object, "__name__"):
-        name = object.__name__
+    name = getattr(object, "__name__", _NOT_FOUND)
+    if name is not _NOT_FOUND:
         prefix = None
-        if hasattr(object, "__module__"):
-            m = object.__module__
+        m = getattr(object, "__module__", _NOT_FOUND)
+        if m is not _NOT_FOUND:
             if m != 'builtins':
                 prefix = origin_name(get_module(m))
         if prefix:
@@ -329,25 +333,21 @@ def get_object(name: str, context: Any = None) -> Any:
     Raises `NameError` when `context` is provided as a string and no
     module can be located for that module name
     '''
-    ctx = context
-    if context is None:
-        ctx = sys.modules
-    elts = name.split(".", 1)
-    n_elts = len(elts)
-    if n_elts is int(0):
-        raise ValueError("Uncrecognized object name: %s" % repr(name), name)
-    elif n_elts is int(1):
-        if isinstance(context, Mapping):
-            return ctx.get(name)
+    elts = name.split(".")
+    last = len(elts) - 1
+    for idx, elt in enumerate(elts):
+        ctx = sys.modules if context is None else context
+        ## each leading name is resolved within ctx, such that the None
+        ## context will be resolved as the sys.modules mapping. The last
+        ## name is resolved within the context as provided
+        if isinstance(context if idx == last else ctx, Mapping):
+            context = ctx.get(elt)
         else:
-            if hasattr(ctx, name):
-                return getattr(ctx, name)
-            else:
+            context = getattr(ctx, elt, _NOT_FOUND)
+            if context is _NOT_FOUND:
                 ctxstr = shorten(repr(ctx), 128)
-                raise ValueError("Object not found: %s in %s" % (name, ctxstr,))
-    else:
-        nextctx = get_object(elts[0], ctx)
-        return get_object(elts[1], nextctx)
+                raise ValueError("Object not found: %s in %s" % (elt, ctxstr,))
+    return context
 
 
 # autopep8: off
@@ -0,0 +1,168 @@
+## tests for pylaborate.basalt.Basalt
+
+from assertpy import assert_that
+import os
+from types import ModuleType
+
+from paver import tasks
+
+import pylaborate.basalt as subject
+
+
+def task_a():
+    pass
+
+
+def task_b():
+    pass
+
+
+def task_c():
+    pass
+
+
+def new_basalt(*needs_c):
+    ## task b needs a, task c needs each named task in needs_c
+    pavement = ModuleType("pavement")
+    a, b, c = tasks.Task(task_a), tasks.Task(task_b), tasks.Task(task_c)
+    b.needs.append("task_a")
+    c.needs.extend(needs_c)
+    for task in (a, b, c):
+        setattr(pavement, task.shortname, task)
+    basalt = subject.Basalt()
+    basalt.environment.pavement = pavement
+    return basalt
+
+
+def count_lookups(basalt):
+    ## record each task lookup under the basalt environment
+    envt = basalt.environment
+    get_task = envt.get_task
+    lookups = []
+
+    def counting_get_task(name):
+        lookups.append(name)
+        return get_task(name)
+
+    envt.get_task = counting_get_task
+    return lookups
+
+
+def test_find_task():
+    basalt = new_basalt()
+    lookups = count_lookups(basalt)
+    a = basalt.find_task("task_a")
+    assert_that(a).is_same_as(basalt.environment.pavement.task_a)
+    assert_that(basalt.find_task("task_a")).is_same_as(a)
+    assert_that(basalt.find_task(a)).is_same_as(a)
+    assert_that(lookups).is_equal_to(["task_a"])
+
+
+def test_find_task_fail():
+    basalt = new_basalt()
+    assert_that(basalt.find_task).raises(ValueError).when_called_with("task_x")
+    assert_that(basalt._task_cache).does_not_contain_key("task_x")
+
+
+def test_dependency_order():
+    basalt = new_basalt("task_b", "task_a")
+    pavement = basalt.environment.pavement
+    lookups = count_lookups(basalt)
+    c = pavement.task_c
+    order = list(basalt.get_dependency_order(c))
+    assert_that(order).is_equal_to([pavement.task_a, pavement.task_b])
+    n_lookups = len(lookups)
+    assert_that(list(basalt.get_dependency_order(c))).is_equal_to(order)
+    assert_that(lookups).is_length(n_lookups)
+    assert_that(list(basalt.get_dependency_order(pavement.task_a))).is_empty()
+
+
+def test_dependency_order_circular():
+    basalt = new_basalt("task_c")
+    c = basalt.environment.pavement.task_c
+    # fmt: off
+    assert_that(list).raises(subject.CircularDependency).when_called_with(
+        basalt.get_dependency_order(c)
+    )
+    # fmt: on
+    assert_that(basalt._dep_order_cache).does_not_contain_key(c.name)
+
+
+def test_fold_exception():
+    ## folded args are matched by identity, at most once
+    basalt = new_basalt()
+    a = basalt.environment.pavement.task_a
+    folded_args, equal_args = ["failed"], ["failed"]
+    basalt.fold_exception(folded_args, a, RuntimeError, ("alternate",), None)
+    basalt.push_exception_info(a, RuntimeError, equal_args, None)
+    basalt.push_exception_info(a, RuntimeError, folded_args, None)
+    assert_that(basalt._fold_exceptions).is_empty()
+    basalt.push_exception_info(a, RuntimeError, folded_args, None)
+    # fmt: off
+    assert_that([info[2] for info in basalt.each_exception()]).is_equal_to(
+        [("alternate",), equal_args, folded_args]
+    )
+    # fmt: on
+    assert_that(basalt._n_exceptions).is_equal_to(3)
+
+
+def test_help_cache(tmp_path):
+    ## the task section of the help text is reused while the paver file
+    ## is unchanged
+    basalt = new_basalt()
+    pavement = basalt.environment.pavement
+    file = tmp_path / "pavement.py"
+    file.write_text("## pavement\n")
+    pavement.__file__ = str(file)
+    lookups = []
+    envt = basalt.environment
+    get_tasks = envt.get_tasks
+
+    def counting_get_tasks():
+        lookups.append(True)
+        return get_tasks()
+
+    envt.get_tasks = counting_get_tasks
+    parser = subject.Basalt.init_argparser(basalt)
+    basalt.configure_argparser(parser)
+    parser.parse_known_args(["-f", str(file)], namespace=basalt.option_namespace)
+    help_text = parser.format_help()
+    assert_that(help_text).contains("task_a", "task_b", "task_c")
+    assert_that(parser.format_help()).is_equal_to(help_text)
+    assert_that(lookups).is_length(1)
+    mtime_ns = file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(file, ns=(mtime_ns, mtime_ns))
+    assert_that(parser.format_help()).is_equal_to(help_text)
+    assert_that(lookups).is_length(2)
+
+
+def test_format_exception_info():
+    basalt = new_basalt()
+    a = basalt.environment.pavement.task_a
+    # fmt: off
+    assert_that(basalt.format_exception_info(a, RuntimeError, ("failed", 1), None)).is_equal_to(
+        "Task error: %s: RuntimeError('failed', 1)\n" % a.name
+    )
+    # fmt: on
+    exc = ValueError("failed")
+    assert_that(basalt.format_exception_info(None, ValueError, exc, None)).is_equal_to(
+        "Error: ValueError('failed')\n"
+    )
+    assert_that(basalt.format_exception_info(None, KeyError, (), None)).is_equal_to(
+        "Error: KeyError\n"
+    )
+
+
+def test_format_exception_traceback():
+    basalt = new_basalt()
+    try:
+        raise RuntimeError("failed")
+    except RuntimeError as exc:
+        tbk = exc.__traceback__
+    info = basalt.format_exception_info(None, RuntimeError, ("failed",), tbk)
+    assert_that(info).does_not_contain("-- Traceback")
+    info = basalt.format_exception_info(None, RuntimeError, ("failed",), tbk, True)
+    assert_that(info).starts_with("Error: RuntimeError('failed')\n-- Traceback\n")
+    assert_that(info).contains("test_format_exception_traceback")
+    info = basalt.format_exception_info(None, RuntimeError, ("failed",), ["frame"], True)
+    assert_that(info).ends_with("-- Traceback\n'frame'\n")
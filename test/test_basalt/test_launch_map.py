@@ -0,0 +1,98 @@
+## tests for pylaborate.basalt.TaskLaunchMap
+
+from assertpy import assert_that
+import asyncio as aio
+import concurrent.futures as cofutures
+
+from paver import tasks
+
+import pylaborate.basalt as subject
+
+
+def task_a():
+    pass
+
+
+def task_b():
+    pass
+
+
+async def task_c():
+    pass
+
+
+def task_d():
+    pass
+
+
+def new_launch_map(loop):
+    ## a sync task b depending on a sync task a, and a sync task d
+    ## depending on an async task c
+    # fmt: off
+    run_context = subject.RunContext(loop, aio.Future(loop = loop), aio.Semaphore(),
+                                     cofutures.ThreadPoolExecutor(max_workers = 1))
+    # fmt: on
+    launch_map = subject.TaskLaunchMap(run_context)
+    a, b = tasks.Task(task_a), tasks.Task(task_b)
+    c, d = tasks.Task(task_c), tasks.Task(task_d)
+    launch_map.create_task_proxy(a, None, run_context, (), (b.name,))
+    launch_map.create_task_proxy(b, None, run_context, (a.name,), ())
+    launch_map.create_task_proxy(c, None, run_context, (), (d.name,))
+    launch_map.create_task_proxy(d, None, run_context, (c.name,), ())
+    launch_map.finalize()
+    return launch_map
+
+
+def test_finalize():
+    loop = aio.new_event_loop()
+    try:
+        launch_map = new_launch_map(loop)
+        assert_that(launch_map.finalize()).is_false()
+        a, b, c, d = launch_map.build_order
+        assert_that(a._deps_mask).is_equal_to(0)
+        assert_that(b._deps_mask).is_equal_to(1 << a._idx)
+        assert_that(d._deps_mask).is_equal_to(1 << c._idx)
+        assert_that(launch_map.get_entry(b.task.name)).is_same_as(b)
+        # fmt: off
+        assert_that(launch_map.create_task_proxy).raises(subject.BoundValue).when_called_with(
+            tasks.Task(task_a), None, a.run_context
+        )
+        # fmt: on
+    finally:
+        loop.close()
+
+
+def test_deps_done_sync():
+    ## a cofutures.Future runs each done callback when the result is set
+    loop = aio.new_event_loop()
+    try:
+        launch_map = new_launch_map(loop)
+        a, b, c, d = launch_map.build_order
+        assert_that(a.run_future).is_instance_of(cofutures.Future)
+        assert_that(b.can_run()).is_true()
+        a.run_future.set_result(None)
+        assert_that(launch_map.deps_done).is_equal_to(1 << a._idx)
+        assert_that(b.can_run()).is_false()
+        assert_that(d.can_run()).is_true()
+    finally:
+        loop.close()
+
+
+def test_deps_done_async():
+    ## the done callback for an aio.Future runs one loop iteration after
+    ## the result is set. can_run() should not depend on that callback
+    loop = aio.new_event_loop()
+    try:
+        launch_map = new_launch_map(loop)
+        a, b, c, d = launch_map.build_order
+        assert_that(c.run_future).is_instance_of(aio.Future)
+        assert_that(d.can_run()).is_true()
+        c.run_future.set_result(None)
+        assert_that(launch_map.deps_done).is_equal_to(0)
+        assert_that(d.can_run()).is_false()
+        loop.run_until_complete(aio.sleep(0))
+        assert_that(launch_map.deps_done).is_equal_to(1 << c._idx)
+        assert_that(d.can_run()).is_false()
+        assert_that(b.can_run()).is_true()
+    finally:
+        loop.close()
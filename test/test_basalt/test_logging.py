@@ -0,0 +1,62 @@
+## tests for log handling under pylaborate.basalt.Cmdline
+
+from assertpy import assert_that
+from contextlib import contextmanager, redirect_stderr
+from io import StringIO
+import logging
+import logging.handlers
+
+import pylaborate.basalt as subject
+
+
+@contextmanager
+def log_listener(name):
+    ## yield a logger, the log listener for the logger, and the stream
+    ## for the listener's handler
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    cmdline = subject.Cmdline()
+    stream = StringIO()
+    with redirect_stderr(stream):
+        cmdline.add_log_handlers(logger)
+    listeners = subject.Cmdline._log_listeners
+    listener = listeners[name]
+    try:
+        yield logger, listener, stream
+    finally:
+        del listeners[name]
+        if listener._thread:
+            ## QueueListener.stop() may not be called twice, at Python 3.11
+            listener.stop()
+        for handler in tuple(logger.handlers):
+            logger.removeHandler(handler)
+
+
+def test_add_log_handlers():
+    name = __name__ + ".test_add_log_handlers"
+    with log_listener(name) as (logger, listener, stream):
+        subject.Cmdline().add_log_handlers(logger)
+        # fmt: off
+        queue_handlers = [handler for handler in logger.handlers
+                          if isinstance(handler, logging.handlers.QueueHandler)]
+        # fmt: on
+        assert_that(queue_handlers).is_length(1)
+        assert_that(queue_handlers[0].queue).is_same_as(listener.queue)
+        assert_that(subject.Cmdline._log_listeners[name]).is_same_as(listener)
+        logger.info("record %d", 1)
+        ## stopping the listener handles any queued records
+        listener.stop()
+        assert_that(stream.getvalue().count("record 1")).is_equal_to(1)
+
+
+def test_flush_log_handlers():
+    name = __name__ + ".test_flush_log_handlers"
+    with log_listener(name) as (logger, listener, stream):
+        ## the queue is drained from the calling thread
+        listener.stop()
+        logger.info("record %d", 2)
+        assert_that(listener.queue.qsize()).is_equal_to(1)
+        subject.Cmdline.flush_log_handlers()
+        assert_that(listener.queue.empty()).is_true()
+        assert_that(stream.getvalue().count("record 2")).is_equal_to(1)
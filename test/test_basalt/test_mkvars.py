@@ -1,6 +1,7 @@
 from assertpy import assert_that
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from pytest import fixture, mark
 
 from pylaborate.basalt.mkvars import optional_files, get_venv_bindir
@@ -129,3 +130,90 @@ def test_setvars():
         assert_that(postdup['requirements_depends']).contains("requirements.in")
 
 
+
+
+def test_dup_override():
+    mkv = subject.MkVars.mkvars(a="x", b="{a}/y", c=["{b}", 1])
+    assert_that(mkv.b).is_equal_to("x/y")
+    mkdup = mkv.dup(a="z")
+    assert_that(mkdup.b).is_equal_to("z/y")
+    assert_that(mkdup.c).is_equal_to(["z/y", 1])
+    assert_that(mkv.b).is_equal_to("x/y")
+    assert_that(mkv.c).is_equal_to(["x/y", 1])
+
+
+_FORMAT_MAPPING = dict(a="xy", w=6, o=SimpleNamespace(b="attr"), s=["first"])
+
+
+@mark.parametrize("source", ["{a!r}", "{a:>5}", "{a:{w}}", "{o.b}", "{s[0]}",
+                             "{{lit}}", "a}}b", "{a}-{w:03d}", "plain"])
+def test_format_compiled(source):
+    parts = subject._compile_format(source)
+    expanded = subject._format_compiled(source, parts, _FORMAT_MAPPING)
+    assert_that(expanded).is_equal_to(source.format_map(_FORMAT_MAPPING))
+
+
+def test_format_compiled_positional():
+    parts = subject._compile_format("{0}")
+    assert_that(parts).is_empty()
+    assert_that(subject._format_compiled).raises(ValueError).when_called_with("{0}", parts, _FORMAT_MAPPING)
+    assert_that("{0}".format_map).raises(ValueError).when_called_with(_FORMAT_MAPPING)
+
+
+def test_format_compiled_missing():
+    parts = subject._compile_format("{a}/{missing}")
+    assert_that(subject._format_compiled).raises(KeyError).when_called_with("{a}/{missing}", parts, _FORMAT_MAPPING)
+    mkv = subject.MkVars.mkvars(a="x", b="{a}/{missing}")
+    assert_that(mkv.__getitem__).raises(KeyError).when_called_with("b")
+
+
+def test_version_cache():
+    mkv = subject.MkVars.mkvars(a="x", b="{a}/y", c="{d}", d="1")
+    assert_that(mkv.b).is_equal_to("x/y")
+    mkv["a"] = "z"
+    assert_that(mkv.b).is_equal_to("z/y")
+    mkv.update(a="w")
+    assert_that(mkv.b).is_equal_to("w/y")
+    del mkv["a"]
+    assert_that(mkv.__getitem__).raises(KeyError).when_called_with("b")
+    mkv["a"] = "{c}"
+    assert_that(mkv.b).is_equal_to("1/y")
+    mkv.mapping["a"].update("{c}{c}")
+    assert_that(mkv.b).is_equal_to("11/y")
+
+
+def test_version_cache_nested():
+    mkv = subject.MkVars.mkvars(a="x", m=dict(k="{a}"), s=["{a}", 1])
+    assert_that(mkv.m).is_equal_to(dict(k="x"))
+    assert_that(mkv.s).is_equal_to(["x", 1])
+    mkv["a"] = "z"
+    assert_that(mkv.m).is_equal_to(dict(k="z"))
+    assert_that(mkv.s).is_equal_to(["z", 1])
+
+
+class _Cell:
+    ## an indexed value, not dispatched as a sequence
+    def __init__(self, value):
+        self.value = value
+
+    def __getitem__(self, idx):
+        return self.value
+
+
+def test_version_cache_fields():
+    mkv = subject.MkVars.mkvars(o=SimpleNamespace(v="1"), s=_Cell("p"), r="{o.v}", t="{s[0]}")
+    assert_that(mkv.r).is_equal_to("1")
+    assert_that(mkv.t).is_equal_to("p")
+    mkv.o.v = "2"
+    mkv.s.value = "q"
+    assert_that(mkv.r).is_equal_to("2")
+    assert_that(mkv.t).is_equal_to("q")
+
+
+def test_version_cache_mapping():
+    mkv = subject.MkVars.mkvars(a="x", b="{a}/y")
+    assert_that(mkv.b).is_equal_to("x/y")
+    mkv.mapping["a"] = "z"
+    assert_that(mkv.b).is_equal_to("z/y")
+    mkv.mapping.update(a="w")
+    assert_that(mkv.b).is_equal_to("w/y")
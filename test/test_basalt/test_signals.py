@@ -0,0 +1,48 @@
+## tests for pylaborate.basalt.SigContext
+
+from assertpy import assert_that
+import asyncio as aio
+import os
+import signal as nsig
+
+import pylaborate.basalt as subject
+
+
+def test_activate_loop():
+    ## a handler installed through the loop is called once, from the loop,
+    ## with the signal as its only arg
+    loop = aio.new_event_loop()
+    previous = nsig.getsignal(nsig.SIGUSR1)
+    received = []
+    try:
+        context = subject.SigContext.activate(nsig.SIGUSR1, received.append, loop)
+        assert_that(context.previous).is_same_as(previous)
+        assert_that(context.loop).is_same_as(loop)
+        os.kill(os.getpid(), nsig.SIGUSR1)
+        loop.run_until_complete(aio.sleep(0.05))
+        assert_that(received).is_equal_to([nsig.SIGUSR1])
+        context.restore()
+        assert_that(nsig.getsignal(nsig.SIGUSR1)).is_same_as(previous)
+        assert_that(loop.remove_signal_handler(nsig.SIGUSR1)).is_false()
+    finally:
+        nsig.signal(nsig.SIGUSR1, previous)
+        loop.close()
+
+
+def test_activate_signal():
+    ## without a loop, the handler is installed with signal.signal()
+    previous = nsig.getsignal(nsig.SIGUSR1)
+    received = []
+
+    def handler(signum, frame):
+        received.append(signum)
+
+    try:
+        context = subject.SigContext.activate(nsig.SIGUSR1, handler)
+        assert_that(nsig.getsignal(nsig.SIGUSR1)).is_same_as(handler)
+        os.kill(os.getpid(), nsig.SIGUSR1)
+        assert_that(received).is_equal_to([nsig.SIGUSR1])
+        context.restore()
+        assert_that(nsig.getsignal(nsig.SIGUSR1)).is_same_as(previous)
+    finally:
+        nsig.signal(nsig.SIGUSR1, previous)
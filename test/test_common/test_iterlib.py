@@ -107,6 +107,36 @@ def test_nth_fail_no_value(empty_range):
 def test_nth_fail_exceeded(n_gen, count):
     assert_that(subject.nth).raises(RuntimeError).when_called_with(count, n_gen)
 
+@mark.dependency(depends=["test_nth"])
+def test_nth_fail_negative(n_range):
+    assert_that(subject.nth).raises(TypeError).when_called_with(-1, n_range)
+
+
+##
+## test consumption of an iterator source
+##
+
+
+@mark.dependency(depends=["test_first"])
+def test_first_iterator(n_gen, start):
+    ## first() should consume only the first value
+    assert_that(subject.first(n_gen)).is_equal_to(start)
+    assert_that(next(n_gen)).is_equal_to(start + 1)
+
+
+@mark.dependency(depends=["test_nth"])
+def test_nth_iterator(n_gen, start):
+    ## nth() should consume only the values up to index n
+    assert_that(subject.nth(2, n_gen)).is_equal_to(start + 2)
+    assert_that(next(n_gen)).is_equal_to(start + 3)
+
+
+@mark.dependency(depends=["test_last"])
+def test_last_iterator(n_gen, count):
+    assert_that(subject.last(n_gen)).is_equal_to(count - 1)
+    assert_that(next(n_gen, None)).is_none()
+
+
 ##
 ## other tests
 ##
@@ -161,3 +191,37 @@ def test_merge_map():
     rslt = subject.merge_map(m1, m2)
     validate_map(rslt, m1, m2)
 
+
+
+def test_merge_map_callback():
+    calls = []
+
+    def merge_cb(key, value, dvalue, exists):
+        calls.append((key, value, dvalue, exists,))
+        return (value, dvalue,) if exists else value
+
+    source = dict(a = 1, b = dict(b1 = "b1", b2 = "b2"), c = None, e = dict(e1 = "e1"))
+    dest = dict(a = 0, b = dict(b1 = "b1_dest"), c = 2, d = None)
+    rslt = subject.merge_map(source, dest, merge_cb)
+    assert_that(rslt).is_same_as(dest)
+    assert_that(rslt).is_equal_to(dict(
+        a = (1, 0), b = dict(b1 = ("b1", "b1_dest"), b2 = "b2"), c = (None, 2), d = None,
+        e = dict(e1 = "e1")
+    ))
+    ## a mapping not present in dest is passed to the callback, not merged
+    assert_that(calls).contains(("e", dict(e1 = "e1"), None, False))
+    assert_that(calls).contains(("b2", "b2", None, False))
+
+
+def test_merge_map_none_value():
+    ## a None value in dest is a value for the key, not a missing key
+    calls = []
+
+    def merge_cb(key, value, dvalue, exists):
+        calls.append((key, exists,))
+        return value
+
+    subject.merge_map(dict(a = 1), dict(a = None), merge_cb)
+    assert_that(calls).is_equal_to([("a", True,)])
+    dest = dict(a = None)
+    assert_that(subject.merge_map(dict(a = dict(x = 1)), dest)).is_equal_to(dict(a = dict(x = 1)))
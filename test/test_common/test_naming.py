@@ -4,6 +4,8 @@ import pylaborate.common_staging.naming as subject
 
 from assertpy import assert_that
 from enum import Enum
+import logging.handlers
+import os
 from pytest import fixture, mark
 from random import randint
 import sys
@@ -203,3 +205,31 @@ def test_get_object():
     }
     # fmt: on
     assert_that(subject.get_object("b.2.c", refmap)).is_equal_to(5)
+
+
+@mark.dependency(depends=["test_get_object"])
+def test_get_object_dotted():
+    ## test for a dotted name starting at the "None" context
+    assert_that(subject.get_object("logging.handlers.QueueHandler")).is_same_as(logging.handlers.QueueHandler)
+    ## test for a dotted name within a module context
+    assert_that(subject.get_object("path.join", os)).is_same_as(os.path.join)
+    ## test for a missing last name within a mapping
+    assert_that(subject.get_object("b.x", {"b": {}})).is_none()
+    ## test for a missing attribute and a missing leading name
+    assert_that(subject.get_object).raises(ValueError).when_called_with("path.nonexistent", os)
+    assert_that(subject.get_object).raises(ValueError).when_called_with("nonexistent.path")
+
+
+@mark.dependency(depends=["test_get_object", "test_origin_name"])
+def test_lookup_falsy_values():
+    ## an attribute with a false value is found, not reported as missing
+    context = ModuleType("mock_falsy")
+    context.none_value = None
+    context.zero_value = 0
+    assert_that(subject.get_object("none_value", context)).is_none()
+    assert_that(subject.get_object("zero_value", context)).is_equal_to(0)
+    ## an object with a __name__ and no __module__
+    named = ModuleType("mock_named")
+    assert_that(hasattr(named, "__module__")).is_false()
+    assert_that(subject.origin_name(named)).is_equal_to("mock_named")
+    assert_that(subject.origin_name).raises(ValueError).when_called_with(object())